@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import atexit
+from dataclasses import asdict, dataclass, fields, is_dataclass
+from functools import lru_cache
 import glob
-import json
+import locale
 from pathlib import Path
 import re
-import shlex
 import subprocess
 import sys
-from typing import Callable, Dict, Iterable, TextIO
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, TextIO
 
 from . import __version__
 from .io_layer import IOAdapter, TextIOAdapter
@@ -26,8 +28,13 @@ from .errors import (
 from .runtime import RuntimeState, _windows_subprocess_kwargs
 from .sandbox import Sandbox
 
+if TYPE_CHECKING:
+    from prompt_toolkit.document import Document
+
 _LOADABLE_SUFFIXES = {".psy", ".psya", ".psyw"}
 _LOAD_ORDER = {".psyw": 0, ".psya": 1, ".psy": 2}
+# Same codec subprocess text=True would pick; child output is captured as bytes and decoded once.
+_CHILD_OUTPUT_ENCODING = locale.getpreferredencoding(False)
 
 
 CommandHandler = Callable[[list[str]], int]
@@ -47,25 +54,54 @@ ANSI_BRIGHT_BLUE = "\033[94m"
 ANSI_CYAN = "\033[96m"
 ANSI_BOLD = "\033[1m"
 ANSI_DIM = "\033[2m"
+# (line, tone, bold) per banner row: first, center, and last rows are emphasized.
+_BANNER_ART = tuple(
+    zip(
+        PSYKER_BANNER_ASCII,
+        (ANSI_BRIGHT_BLUE, ANSI_BLUE, ANSI_CYAN, ANSI_BLUE, ANSI_BRIGHT_BLUE),
+        (True, False, True, False, True),
+    )
+)
 ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+# Closed set of escapes this module emits; _visible_len counts these instead of running ANSI_PATTERN.
+_ANSI_SEQS = tuple((seq, len(seq)) for seq in (ANSI_RESET, ANSI_BLUE, ANSI_RED, ANSI_BRIGHT_BLUE, ANSI_CYAN, ANSI_BOLD, ANSI_DIM))
+_BANNER_PREFIX = {
+    (color, bold, dim): (ANSI_DIM if dim else "") + (ANSI_BOLD if bold else "") + color
+    for color in (ANSI_BLUE, ANSI_BRIGHT_BLUE, ANSI_CYAN, ANSI_RED)
+    for bold in (False, True)
+    for dim in (False, True)
+}
 FLAG_PATTERN = re.compile(r"--[a-zA-Z0-9-]+")
+# Group-reference template so re substitutes flags in C without a Python callback per match.
+FLAG_REPLACEMENT = f"{ANSI_RED}\\g<0>{ANSI_RESET}"
+_VERB_PATTERN = re.compile(r"^(\s*)(\S+)")
+_HISTORY_FILE_NAME = ".psyker_history"
+_HISTORY_LENGTH = 1000
 PROMPT_TEXT = "PSYKER> "
-
-try:  # optional; enables live highlighting while typing
-    from prompt_toolkit import prompt as _pt_prompt
-    from prompt_toolkit.document import Document as _pt_Document
-    from prompt_toolkit.history import InMemoryHistory as _pt_InMemoryHistory
-    from prompt_toolkit.lexers import Lexer as _pt_Lexer
-    from prompt_toolkit.styles import Style as _pt_Style
+_RAW_TAIL_VERBS = frozenset({"ps", "cmd"})
+_RAW_TAIL_ARG_BREAK = re.compile(r'"\s+"')
+# Backslash escapes shlex honours inside double quotes.
+_RAW_TAIL_ESCAPE = re.compile(r'\\[\\"$`]')
+_EXIT_VERBS = frozenset({"exit", "quit"})
+
+try:  # optional; C-accelerated JSON for stx --output json
+    import orjson as _orjson
 except Exception:  # pragma: no cover - optional dependency
-    _pt_prompt = None
-    _pt_Document = None
-    _pt_InMemoryHistory = None
-    _pt_Lexer = None
-    _pt_Style = None
+    _orjson = None
+
+@lru_cache(maxsize=1)
+def _prompt_toolkit() -> tuple[Callable[..., str], type, type] | None:
+    # Optional (live highlighting while typing); imported on the first interactive REPL start.
+    try:
+        from prompt_toolkit import prompt
+        from prompt_toolkit.history import InMemoryHistory
+        from prompt_toolkit.styles import Style
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return prompt, InMemoryHistory, Style
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandDef:
     handler: CommandHandler
     usage: str
@@ -73,46 +109,58 @@ class CommandDef:
 
 
 class _PsykerInputLexer:  # prompt_toolkit lexer (duck-typed)
-    def __init__(self, commands: set[str]) -> None:
-        self._commands = commands
+    def __init__(self, commands: Iterable[str]) -> None:
+        self._commands = frozenset(commands)
+        # prompt_toolkit re-lexes on cursor moves with unchanged text; reuse the last result.
+        self._last_text: str | None = None
+        self._last_parts: list[tuple[str, str]] = []
 
-    def lex_document(self, document: "_pt_Document"):  # type: ignore[name-defined]
+    def lex_document(self, document: "Document"):
         text = document.text
+        if text != self._last_text:
+            self._last_parts = self._tokenize(text)
+            self._last_text = text
+        parts = self._last_parts
 
         def get_line(_line_number: int) -> list[tuple[str, str]]:
-            if not text:
-                return []
-            parts: list[tuple[str, str]] = []
-
-            # First token (verb) in blue
-            m = re.match(r"^\s*(\S+)", text)
-            if m:
-                start, end = m.span(1)
-                prefix = text[:start]
-                verb = text[start:end]
-                rest = text[end:]
-                if prefix:
-                    parts.append(("", prefix))
-                style = "class:command" if verb in self._commands else ""
-                parts.append((style, verb))
-                text_to_scan = rest
-            else:
-                text_to_scan = text
-
-            # Flags (--) in red, everything else default.
-            idx = 0
-            for fm in FLAG_PATTERN.finditer(text_to_scan):
-                if fm.start() > idx:
-                    parts.append(("", text_to_scan[idx : fm.start()]))
-                parts.append(("class:flag", fm.group(0)))
-                idx = fm.end()
-            if idx < len(text_to_scan):
-                parts.append(("", text_to_scan[idx:]))
-
             return parts
 
         return get_line
 
+    def _tokenize(self, text: str) -> list[tuple[str, str]]:
+        if not text:
+            return []
+
+        # First token (verb) in blue
+        m = _VERB_PATTERN.match(text)
+        if m:
+            prefix, verb = m.group(1), m.group(2)
+            style = "class:command" if verb in self._commands else ""
+            parts = [("", prefix), (style, verb)] if prefix else [(style, verb)]
+            text_to_scan = text[m.end() :]
+        else:
+            parts = []
+            text_to_scan = text
+        if not text_to_scan:
+            return parts
+        if "--" not in text_to_scan:
+            parts.append(("", text_to_scan))
+            return parts
+
+        # Flags (--) in red, everything else default.
+        idx = 0
+        for fm in FLAG_PATTERN.finditer(text_to_scan):
+            start, end = fm.span()
+            if start > idx:
+                parts.extend((("", text_to_scan[idx:start]), ("class:flag", text_to_scan[start:end])))
+            else:
+                parts.append(("class:flag", text_to_scan[start:end]))
+            idx = end
+        if idx < len(text_to_scan):
+            parts.append(("", text_to_scan[idx:]))
+
+        return parts
+
 
 class PsykerCLI:
     def __init__(
@@ -128,9 +176,24 @@ class PsykerCLI:
         self.verbose = verbose
         self._cancel_requested = False
         self.runtime.set_cancel_check(self.is_cancel_requested)
-        self.commands: Dict[str, CommandDef] = {}
+        # Command tables are built once at import; instances only pick the variant for the batch flag.
+        self._command_table = _COMMAND_TABLES[_batch_feature_enabled()]
+        self._commands: dict[str, CommandDef] | None = None
         self.last_exit_code = 0
-        self._register_commands()
+        self._help_tables: dict[bool, str] = {}
+        self._help_entries: dict[tuple[str, bool], str] = {}
+        self._banner_lines: dict[bool, list[str]] = {}
+        self._ls_rows_cache: dict[str, tuple[int, tuple[tuple[str, str, str], ...]]] = {}
+
+    @property
+    def commands(self) -> dict[str, CommandDef]:
+        # Built on first access so handlers are bound to this instance (and any overrides).
+        if self._commands is None:
+            self._commands = {
+                verb: CommandDef(handler=getattr(self, method_name), usage=usage, description=description)
+                for verb, (method_name, usage, description) in self._command_table.items()
+            }
+        return self._commands
 
     def run_repl(self) -> int:
         self._print_startup_banner()
@@ -138,20 +201,20 @@ class PsykerCLI:
             f"sandbox root={self.runtime.sandbox.root} workspace={self.runtime.sandbox.workspace}"
         )
 
-        use_prompt_toolkit = (
-            _pt_prompt is not None
-            and _pt_Style is not None
-            and _pt_InMemoryHistory is not None
-            and self._io.supports_colors
-            and bool(getattr(sys.stdin, "isatty", lambda: False)())
-        )
+        stdin_is_tty = bool(getattr(sys.stdin, "isatty", lambda: False)())
+        toolkit = _prompt_toolkit() if stdin_is_tty and self._io.supports_colors else None
+        use_prompt_toolkit = toolkit is not None
+
+        if stdin_is_tty and not use_prompt_toolkit and isinstance(self._io, TextIOAdapter):
+            _enable_readline_history(self.runtime.sandbox.root / _HISTORY_FILE_NAME)
 
         pt_style = None
         pt_lexer = None
         pt_history = None
         pt_prompt: object = PROMPT_TEXT
-        if use_prompt_toolkit:
-            pt_style = _pt_Style.from_dict(
+        if toolkit is not None:
+            pt_read, pt_history_cls, pt_style_cls = toolkit
+            pt_style = pt_style_cls.from_dict(
                 {
                     "prompt": "ansibrightblue bold",
                     "command": "ansibrightblue bold",
@@ -159,15 +222,15 @@ class PsykerCLI:
                     "": "#c7d5e0",
                 }
             )
-            pt_lexer = _PsykerInputLexer(set(self.commands.keys()))
-            pt_history = _pt_InMemoryHistory()
+            pt_lexer = _PsykerInputLexer(self._command_table)
+            pt_history = pt_history_cls()
             pt_prompt = [("class:prompt", PROMPT_TEXT)]
 
         while True:
             try:
                 if use_prompt_toolkit:
                     try:
-                        line = _pt_prompt(  # type: ignore[misc]
+                        line = pt_read(
                             pt_prompt,
                             style=pt_style,
                             lexer=pt_lexer,
@@ -190,30 +253,36 @@ class PsykerCLI:
                 return self.last_exit_code
             code = self.execute_line(line)
             self.last_exit_code = code
-            if code == 0 and line.strip().lower() in {"exit", "quit"}:
+            # Verbs are case-sensitive, so a zero exit code already rules out "EXIT"/"Quit".
+            if code == 0 and line.strip() in _EXIT_VERBS:
                 return 0
 
     def execute_line(self, line: str) -> int:
         text = line.strip()
         if not text:
             return 0
-        try:
-            parts = shlex.split(text)
-        except ValueError as exc:
-            self._eprintln(f"error[CliParse]: {exc}")
-            return 1
+        raw = _split_raw_tail(text)
+        if raw is not None:
+            parts = list(raw)
+        else:
+            try:
+                parts = list(split_command_line(text))
+            except ValueError as exc:
+                self._eprintln(f"error[CliParse]: {exc}")
+                return 1
         if not parts:
             return 0
 
         verb = parts[0]
         args = parts[1:]
-        command = self.commands.get(verb)
-        if command is None:
+        spec = self._command_table.get(verb)
+        if spec is None:
             self._eprintln(f"error[CliCommand]: unknown command '{verb}'")
             return 1
 
         try:
-            return command.handler(args)
+            # Resolved per call so subclass overrides and instance patches are honoured.
+            return getattr(self, spec[0])(args)
         except PsykerError as exc:
             self._eprintln(exc.to_diagnostic())
             return map_error_to_exit_code(exc)
@@ -221,45 +290,26 @@ class PsykerCLI:
             self._eprintln(f"error[GeneralError]: {exc}")
             return 1
 
-    def _register_commands(self) -> None:
-        self._register("ls", self._cmd_ls, "ls workers|agents|tasks", "List loaded definitions.")
-        self._register(
-            "stx",
-            self._cmd_stx,
-            "stx worker|agent|task <name> [--output table|json]",
-            "Inspect one loaded definition.",
-        )
-        self._register(
-            "load",
-            self._cmd_load,
-            "load <path|glob> | load --dir <path>",
-            "Load a .psy/.psya/.psyw file or all such files in a directory.",
-        )
-        self._register("run", self._cmd_run, "run <agent> <task> [task2 ...]", "Run one or more tasks through an agent (fail-fast).")
-        if _batch_feature_enabled():
-            self._register("batch", self._cmd_batch, "batch <agent> <batch_name>", "Run a batch block through an agent.")
-        self._register("open", self._cmd_open, "open <path>", "Print file contents from sandbox workspace.")
-        self._register("mkfile", self._cmd_mkfile, "mkfile <path>", "Create a file in sandbox workspace.")
-        self._register("mkdir", self._cmd_mkdir, "mkdir <path>", "Create a directory in sandbox workspace.")
-        self._register("ps", self._cmd_ps, 'ps "<powershell command>"', "Run a PowerShell command in sandbox workspace.")
-        self._register("cmd", self._cmd_cmd, 'cmd "<cmd command>"', "Run a cmd command in sandbox workspace.")
-        self._register(
-            "sandbox",
-            self._cmd_sandbox,
-            "sandbox reset [--logs|--clear-logs]",
-            "Reset sandbox workspace/tmp (optionally logs).",
-        )
-        self._register(
-            "help",
-            self._cmd_help,
-            "help [--cmds|--version|--about|<command>]",
-            "Show command help and Psyker metadata.",
-        )
-        self._register("exit", self._cmd_exit, "exit", "Exit the REPL.")
-        self._register("quit", self._cmd_exit, "quit", "Exit the REPL.")
-
-    def _register(self, verb: str, handler: CommandHandler, usage: str, description: str) -> None:
-        self.commands[verb] = CommandDef(handler=handler, usage=usage, description=description)
+    def _render_help_table(self, colors: bool) -> str:
+        rows = [
+            [self._color_command(name, colors), self._color_flags(usage, colors), description]
+            for name, (_, usage, description) in self._command_table.items()
+        ]
+        return _render_table(["command", "usage", "description"], rows)
+
+    def _ls_rows(self, target: str) -> tuple[tuple[str, str, str], ...]:
+        # Sorting and counting only happen once per load; repeat ls calls reuse the rows.
+        version = self.runtime.version
+        cached = self._ls_rows_cache.get(target)
+        if cached is None or cached[0] != version:
+            type_name, _, count = _LS_LAYOUT[target]
+            rows = tuple(
+                (name, type_name, str(count(item)))
+                for name, item in sorted(getattr(self.runtime, target).items())
+            )
+            cached = (version, rows)
+            self._ls_rows_cache[target] = cached
+        return cached[1]
 
     def _cmd_ls(self, args: list[str]) -> int:
         valid_targets = {"workers", "agents", "tasks"}
@@ -271,31 +321,8 @@ class PsykerCLI:
                 usage += "|batches"
             raise PsykerError(f"Usage: {usage}")
         target = args[0]
-        if target == "workers":
-            rows = [
-                [name, "worker", str(len(worker.allows))]
-                for name, worker in sorted(self.runtime.workers.items())
-            ]
-            self._println(_render_table(["name", "type", "capabilities"], rows))
-            return 0
-        if target == "agents":
-            rows = []
-            for name, agent in sorted(self.runtime.agents.items()):
-                count = sum(item.count for item in agent.uses)
-                rows.append([name, "agent", str(count)])
-            self._println(_render_table(["name", "type", "worker_instances"], rows))
-            return 0
-        if target == "batches":
-            rows = [
-                [name, "batch", str(len(batch.steps))]
-                for name, batch in sorted(self.runtime.batches.items())
-            ]
-            self._println(_render_table(["name", "type", "steps"], rows))
-            return 0
-        rows = []
-        for name, task in sorted(self.runtime.tasks.items()):
-            rows.append([name, "task", str(len(task.statements))])
-        self._println(_render_table(["name", "type", "statements"], rows))
+        count_header = _LS_LAYOUT[target][1]
+        self._println(_render_table(["name", "type", count_header], self._ls_rows(target)))
         return 0
 
     def _cmd_stx(self, args: list[str]) -> int:
@@ -309,32 +336,25 @@ class PsykerCLI:
                 raise PsykerError("Usage: stx worker|agent|task <name> [--output table|json]")
             output = args[3]
 
-        data = self._inspect_object(kind, name)
+        obj = self._inspect_object(kind, name)
         if output == "json":
-            self._println(json.dumps(data, indent=2, sort_keys=True, default=str))
+            self._println(_dumps_pretty_json(asdict(obj)))
             return 0
 
-        rows = [[key, _format_value(value)] for key, value in data.items()]
+        # Table output reads fields directly; nested values are serialized only when rendered.
+        rows = [[field.name, _format_value(getattr(obj, field.name))] for field in fields(obj)]
         self._println(_render_table(["field", "value"], rows))
         return 0
 
-    def _inspect_object(self, kind: str, name: str) -> dict:
-        if kind == "worker":
-            worker = self.runtime.workers.get(name)
-            if worker is None:
-                raise PsykerError(f"Unknown worker '{name}'")
-            return asdict(worker)
-        if kind == "agent":
-            agent = self.runtime.agents.get(name)
-            if agent is None:
-                raise PsykerError(f"Unknown agent '{name}'")
-            return asdict(agent)
-        if kind == "task":
-            task = self.runtime.tasks.get(name)
-            if task is None:
-                raise PsykerError(f"Unknown task '{name}'")
-            return asdict(task)
-        raise PsykerError("stx target must be one of: worker, agent, task")
+    def _inspect_object(self, kind: str, name: str) -> object:
+        # Returns the live definition; callers choose deep (json) or shallow (table) views.
+        collection = _STX_COLLECTIONS.get(kind)
+        if collection is None:
+            raise PsykerError("stx target must be one of: worker, agent, task")
+        obj = getattr(self.runtime, collection).get(name)
+        if obj is None:
+            raise PsykerError(f"Unknown {kind} '{name}'")
+        return obj
 
     def _cmd_load(self, args: list[str]) -> int:
         if len(args) == 1:
@@ -366,24 +386,29 @@ class PsykerCLI:
         if not root.exists() or not root.is_dir():
             raise PsykerError(f"Directory not found: {directory}")
 
-        files = [path for path in root.iterdir() if path.is_file() and path.suffix.lower() in _LOADABLE_SUFFIXES]
-        files = self._sorted_load_candidates(files)
+        files = self._sorted_load_candidates(root.iterdir())
 
         for path in files:
             self._load_single_file(path)
 
     def _load_glob(self, pattern: str) -> None:
-        matches = [Path(raw) for raw in glob.glob(pattern, recursive=True)]
-        files = [path for path in matches if path.is_file() and path.suffix.lower() in _LOADABLE_SUFFIXES]
-        files = self._sorted_load_candidates(files)
+        files = self._sorted_load_candidates(Path(raw) for raw in glob.glob(pattern, recursive=True))
         if not files:
             raise PsykerError(f"No loadable files matched glob: {pattern}")
 
         for path in files:
             self._load_single_file(path)
 
-    def _sorted_load_candidates(self, files: list[Path]) -> list[Path]:
-        return sorted(files, key=lambda path: (_LOAD_ORDER[path.suffix.lower()], path.name.lower(), str(path).lower()))
+    def _sorted_load_candidates(self, paths: Iterable[Path]) -> list[Path]:
+        # Filter and build sort keys in one pass so each suffix is lowered once per file.
+        keyed: list[tuple[tuple[int, str, str], Path]] = []
+        for path in paths:
+            order = _LOAD_ORDER.get(path.suffix.lower())
+            if order is None or not path.is_file():
+                continue
+            keyed.append(((order, path.name.lower(), str(path).lower()), path))
+        keyed.sort(key=lambda item: item[0])
+        return [path for _, path in keyed]
 
     def _cmd_run(self, args: list[str]) -> int:
         if len(args) < 2:
@@ -431,7 +456,10 @@ class PsykerCLI:
         target = self.runtime.sandbox.resolve_in_workspace(args[0])
         if not target.exists() or not target.is_file():
             raise ExecError(f"File not found: {target}")
-        self._println(target.read_text(encoding="utf-8"))
+        text = target.read_bytes().decode("utf-8")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        self._println(text)
         return 0
 
     def _cmd_mkfile(self, args: list[str]) -> int:
@@ -482,33 +510,56 @@ class PsykerCLI:
         cwd = self.runtime.sandbox.workspace
         cwd.mkdir(parents=True, exist_ok=True)
         try:
-            proc = subprocess.run(
+            proc = subprocess.Popen(
                 command,
                 cwd=cwd,
-                capture_output=True,
-                text=True,
-                check=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 **_windows_subprocess_kwargs(),
             )
         except OSError as exc:
             raise ExecError(f"Failed to execute '{command[0]}': {exc}") from exc
-        if proc.stdout:
-            self._println(proc.stdout.rstrip("\n"))
-        if proc.stderr:
-            self._eprintln(proc.stderr.rstrip("\n"))
+        stdout, stderr = self._communicate(proc)
+        if stdout:
+            self._println(_decode_child_output(stdout))
+        if stderr:
+            self._eprintln(_decode_child_output(stderr))
         if proc.returncode != 0:
             raise ExecError(f"Command failed with exit code {proc.returncode}")
         return 0
 
+    def _communicate(self, proc: subprocess.Popen) -> tuple[bytes, bytes]:
+        # Poll like RuntimeState._run_process so the GUI Stop button can interrupt ps/cmd.
+        try:
+            while True:
+                try:
+                    return proc.communicate(timeout=0.1)
+                except subprocess.TimeoutExpired:
+                    if not self._cancel_requested:
+                        continue
+                proc.terminate()
+                try:
+                    proc.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait(timeout=1)
+                raise ExecError("Command cancelled by user.")
+        except BaseException:
+            # Like subprocess.run: never leave the windowless child running (e.g. on Ctrl+C).
+            proc.kill()
+            proc.wait()
+            raise
+
     def _cmd_help(self, args: list[str]) -> int:
         if len(args) > 1:
             raise PsykerError("Usage: help [--cmds|--version|--about|<command>]")
         if not args or args[0] == "--cmds":
-            rows = [
-                [self._color_command(name), self._color_flags(cmd.usage), cmd.description]
-                for name, cmd in sorted(self.commands.items())
-            ]
-            self._println(_render_table(["command", "usage", "description"], rows))
+            colors = self._colors_enabled()
+            table = self._help_tables.get(colors)
+            if table is None:
+                table = self._render_help_table(colors)
+                self._help_tables[colors] = table
+            self._println(table)
             return 0
         if args[0] == "--version":
             self._println(f"Psyker v{__version__}")
@@ -520,10 +571,16 @@ class PsykerCLI:
             raise PsykerError(
                 f"Unknown help option '{args[0]}'. Use: help [--cmds|--version|--about|<command>]"
             )
-        command = self.commands.get(args[0])
-        if command is None:
+        spec = self._command_table.get(args[0])
+        if spec is None:
             raise PsykerError(f"Unknown command '{args[0]}'")
-        self._println(f"{self._color_command(args[0])}: {command.description}\nusage: {self._color_flags(command.usage)}")
+        key = (args[0], self._colors_enabled())
+        entry = self._help_entries.get(key)
+        if entry is None:
+            _, usage, description = spec
+            entry = f"{self._color_command(args[0])}: {description}\nusage: {self._color_flags(usage)}"
+            self._help_entries[key] = entry
+        self._println(entry)
         return 0
 
     def _cmd_exit(self, args: list[str]) -> int:
@@ -532,23 +589,29 @@ class PsykerCLI:
         return 0
 
     def _print_startup_banner(self) -> None:
-        self._println(self._color_banner_line(WELCOME_LINE, color=ANSI_BRIGHT_BLUE, bold=True))
-        self._println(self._color_banner_line(WELCOME_BYLINE, color=ANSI_CYAN))
+        colors = self._colors_enabled()
+        lines = self._banner_lines.get(colors)
+        if lines is None:
+            lines = self._build_banner_lines()
+            self._banner_lines[colors] = lines
+        self._io.write_lines(lines)
+
+    def _build_banner_lines(self) -> list[str]:
+        lines = [
+            self._color_banner_line(WELCOME_LINE, color=ANSI_BRIGHT_BLUE, bold=True),
+            self._color_banner_line(WELCOME_BYLINE, color=ANSI_CYAN),
+        ]
 
         if self._colors_enabled():
-            self._println(self._color_banner_line("[metro] bundling psychic shell...", color=ANSI_BLUE, dim=True))
-            self._println(self._color_banner_line("[metro] calibrating hex-eye matrix...", color=ANSI_BLUE, dim=True))
+            lines.append(self._color_banner_line("[metro] bundling psychic shell...", color=ANSI_BLUE, dim=True))
+            lines.append(self._color_banner_line("[metro] calibrating hex-eye matrix...", color=ANSI_BLUE, dim=True))
 
-        tones = (ANSI_BRIGHT_BLUE, ANSI_BLUE, ANSI_CYAN, ANSI_BLUE, ANSI_BRIGHT_BLUE)
-        center_line = len(PSYKER_BANNER_ASCII) // 2
-        for idx, line in enumerate(PSYKER_BANNER_ASCII):
-            tone = tones[idx % len(tones)]
-            emph = idx in {0, center_line, len(PSYKER_BANNER_ASCII) - 1}
-            self._println(self._color_banner_line(line, color=tone, bold=emph))
+        lines.extend(self._color_banner_line(line, color=tone, bold=emph) for line, tone, emph in _BANNER_ART)
 
         if self._colors_enabled():
-            self._println(self._color_banner_line("[metro] psychic mesh online", color=ANSI_CYAN, dim=True))
-        self._println("")
+            lines.append(self._color_banner_line("[metro] psychic mesh online", color=ANSI_CYAN, dim=True))
+        lines.append("")
+        return lines
 
     def _println(self, text: str) -> None:
         self._io.write(text)
@@ -572,37 +635,91 @@ class PsykerCLI:
     def _colors_enabled(self) -> bool:
         return self._io.supports_colors
 
-    def _color_command(self, text: str) -> str:
-        if not self._colors_enabled():
+    def _color_command(self, text: str, colors: bool | None = None) -> str:
+        if not (self._colors_enabled() if colors is None else colors):
             return text
         return f"{ANSI_BLUE}{text}{ANSI_RESET}"
 
-    def _color_flags(self, text: str) -> str:
-        if not self._colors_enabled():
+    def _color_flags(self, text: str, colors: bool | None = None) -> str:
+        if "--" not in text or not (self._colors_enabled() if colors is None else colors):
             return text
-        return FLAG_PATTERN.sub(lambda m: f"{ANSI_RED}{m.group(0)}{ANSI_RESET}", text)
+        return FLAG_PATTERN.sub(FLAG_REPLACEMENT, text)
 
     def _color_banner_line(self, text: str, color: str = ANSI_BLUE, bold: bool = False, dim: bool = False) -> str:
         if not self._colors_enabled():
             return text
-        prefix = ""
-        if dim:
-            prefix += ANSI_DIM
-        if bold:
-            prefix += ANSI_BOLD
-        prefix += color
-        return f"{prefix}{text}{ANSI_RESET}"
+        return f"{_BANNER_PREFIX[(color, bold, dim)]}{text}{ANSI_RESET}"
+
+
+# (verb, PsykerCLI method name, usage, description); methods are looked up on the instance at dispatch.
+_COMMAND_SPECS: tuple[tuple[str, str, str, str], ...] = (
+    ("ls", "_cmd_ls", "ls workers|agents|tasks", "List loaded definitions."),
+    ("stx", "_cmd_stx", "stx worker|agent|task <name> [--output table|json]", "Inspect one loaded definition."),
+    (
+        "load",
+        "_cmd_load",
+        "load <path|glob> | load --dir <path>",
+        "Load a .psy/.psya/.psyw file or all such files in a directory.",
+    ),
+    ("run", "_cmd_run", "run <agent> <task> [task2 ...]", "Run one or more tasks through an agent (fail-fast)."),
+    ("batch", "_cmd_batch", "batch <agent> <batch_name>", "Run a batch block through an agent."),
+    ("open", "_cmd_open", "open <path>", "Print file contents from sandbox workspace."),
+    ("mkfile", "_cmd_mkfile", "mkfile <path>", "Create a file in sandbox workspace."),
+    ("mkdir", "_cmd_mkdir", "mkdir <path>", "Create a directory in sandbox workspace."),
+    (
+        "ps",
+        "_cmd_ps",
+        'ps "<powershell command>"',
+        "Run a PowerShell command in sandbox workspace (inner quotes are kept as typed).",
+    ),
+    ("cmd", "_cmd_cmd", 'cmd "<cmd command>"', "Run a cmd command in sandbox workspace (inner quotes are kept as typed)."),
+    ("sandbox", "_cmd_sandbox", "sandbox reset [--logs|--clear-logs]", "Reset sandbox workspace/tmp (optionally logs)."),
+    ("help", "_cmd_help", "help [--cmds|--version|--about|<command>]", "Show command help and Psyker metadata."),
+    ("exit", "_cmd_exit", "exit", "Exit the REPL."),
+    ("quit", "_cmd_exit", "quit", "Exit the REPL."),
+)
+_FEATURE_GATED_VERBS = frozenset({"batch"})
+
+_STX_COLLECTIONS = {"worker": "workers", "agent": "agents", "task": "tasks"}
+
+# ls target -> (type label, count column header, count of the definition).
+_LS_LAYOUT: dict[str, tuple[str, str, Callable[[object], int]]] = {
+    "workers": ("worker", "capabilities", lambda worker: len(worker.allows)),
+    "agents": ("agent", "worker_instances", lambda agent: sum(item.count for item in agent.uses)),
+    "tasks": ("task", "statements", lambda task: len(task.statements)),
+    "batches": ("batch", "steps", lambda batch: len(batch.steps)),
+}
+
+
+def _build_command_table(include_batch: bool) -> Mapping[str, tuple[str, str, str]]:
+    # verb -> (method name, usage, description), in verb order for help output.
+    table: dict[str, tuple[str, str, str]] = {}
+    for verb, method_name, usage, description in sorted(_COMMAND_SPECS):
+        if verb in _FEATURE_GATED_VERBS and not include_batch:
+            continue
+        table[sys.intern(verb)] = (method_name, usage, description)
+    return MappingProxyType(table)
+
+
+_COMMAND_TABLES = {include_batch: _build_command_table(include_batch) for include_batch in (False, True)}
+
+
+_EXIT_CODES: dict[type, int] = {
+    SyntaxError: 2,
+    DialectError: 2,
+    AccessError: 3,
+    PermissionError: 3,
+    SandboxError: 4,
+    ExecError: 5,
+}
 
 
 def map_error_to_exit_code(exc: Exception) -> int:
-    if isinstance(exc, (SyntaxError, DialectError)):
-        return 2
-    if isinstance(exc, (AccessError, PermissionError)):
-        return 3
-    if isinstance(exc, SandboxError):
-        return 4
-    if isinstance(exc, ExecError):
-        return 5
+    # Walk the MRO so subclasses inherit their base error's exit code.
+    for cls in type(exc).__mro__:
+        code = _EXIT_CODES.get(cls)
+        if code is not None:
+            return code
     return 1
 
 
@@ -616,38 +733,166 @@ def create_default_cli(
     return PsykerCLI(runtime=runtime, out=out, err=err, verbose=verbose)
 
 
-def _render_table(headers: list[str], rows: Iterable[list[str]]) -> str:
-    materialized = [list(row) for row in rows]
-    if not materialized:
+def _render_table(headers: list[str], rows: Iterable[Iterable[str]]) -> str:
+    # Stringify and measure each cell once; padding reuses the measured width.
+    cells = [[(text, _visible_len(text)) for text in map(str, row)] for row in rows]
+    if not cells:
         return "(empty)"
-    widths = [_visible_len(h) for h in headers]
-    for row in materialized:
-        for idx, value in enumerate(row):
-            widths[idx] = max(widths[idx], _visible_len(str(value)))
-    header = " | ".join(_ljust_visible(headers[idx], widths[idx]) for idx in range(len(headers)))
-    divider = "-+-".join("-" * widths[idx] for idx in range(len(headers)))
-    body = "\n".join(
-        " | ".join(_ljust_visible(str(row[idx]), widths[idx]) for idx in range(len(headers)))
-        for row in materialized
+    headers = tuple(headers)
+    widths = tuple(
+        max(_visible_len(header), *(length for _, length in column))
+        for header, column in zip(headers, zip(*cells))
+    )
+    # ljust pads in C; widening by the hidden ANSI length keeps colored cells aligned.
+    lines = [_table_head(headers, widths)]
+    lines.extend(
+        " | ".join([text.ljust(width + len(text) - length) for (text, length), width in zip(row, widths)])
+        for row in cells
+    )
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=32)
+def _table_head(headers: tuple[str, ...], widths: tuple[int, ...]) -> str:
+    # ls/help/stx reuse a handful of header sets; steady-state widths hit this cache.
+    header = " | ".join(
+        [text.ljust(width + len(text) - _visible_len(text)) for text, width in zip(headers, widths)]
     )
-    return f"{header}\n{divider}\n{body}"
+    return header + "\n" + "-+-".join("-" * width for width in widths)
+
+
+_EMPTY_JSON = {list: "[]", tuple: "[]", dict: "{}"}
 
 
 def _format_value(value: object) -> str:
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is int:
+        return str(value)
+    if value_type in _EMPTY_JSON and not value:
+        return _EMPTY_JSON[value_type]
+    if is_dataclass(value) and not isinstance(value, type):
+        value = asdict(value)
     if isinstance(value, (dict, list, tuple)):
-        return json.dumps(value, sort_keys=True)
+        import json
+
+        return json.dumps(value, sort_keys=True, default=_dataclass_to_json)
     if value is None:
         return "null"
     return str(value)
 
 
+def _dumps_pretty_json(data: dict) -> str:
+    if _orjson is not None:
+        text = _orjson.dumps(data, option=_orjson.OPT_INDENT_2 | _orjson.OPT_SORT_KEYS, default=str).decode("utf-8")
+        # orjson cannot escape non-ASCII; keep json.dumps' \uXXXX output for strict console encodings.
+        if text.isascii():
+            return text
+    import json
+
+    return json.dumps(data, indent=2, sort_keys=True, default=str)
+
+
+def _dataclass_to_json(value: object) -> object:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_child_output(data: bytes) -> str:
+    # Mirror text=True universal newlines so Windows "\r\n" output renders like before.
+    text = data.rstrip(b"\r\n").decode(_CHILD_OUTPUT_ENCODING, errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def split_command_line(text: str) -> tuple[str, ...]:
+    """Tokenize a command line like shlex.split; raises ValueError on unbalanced quotes."""
+    if _is_plain_command(text):
+        return tuple(text.split())
+    return _shlex_split_cached(text)
+
+
+def _is_plain_command(text: str) -> bool:
+    # Without quotes/escapes, and with space as the only whitespace (isprintable rejects
+    # tabs, newlines and other separators), str.split() tokenizes exactly like shlex.split().
+    return '"' not in text and "'" not in text and "\\" not in text and text.isprintable()
+
+
+def _split_raw_tail(text: str) -> tuple[str, str] | None:
+    # ps/cmd hand one quoted string to another shell; pass it through instead of
+    # re-parsing it with shlex, which chokes on the nested quotes shells use.
+    verb, _, rest = text.partition(" ")
+    if verb not in _RAW_TAIL_VERBS:
+        return None
+    rest = rest.strip()
+    if len(rest) < 2 or rest[0] != '"' or rest[-1] != '"':
+        return None
+    inner = rest[1:-1]
+    # Only nested quotes differ from shlex: escapes keep their shlex meaning, unbalanced quotes
+    # still fail to parse, and '"a" "b"' stays two arguments (a usage error).
+    if inner.count('"') % 2 or _RAW_TAIL_ESCAPE.search(inner) or _RAW_TAIL_ARG_BREAK.search(inner):
+        return None
+    return verb, inner
+
+
+@lru_cache(maxsize=128)
+def _shlex_split_cached(text: str) -> tuple[str, ...]:
+    # Tuples keep cached tokens immutable; REPL history makes repeated lines common.
+    import shlex
+
+    return tuple(shlex.split(text))
+
+
+@lru_cache(maxsize=4096)
 def _visible_len(text: str) -> int:
+    escapes = text.count("\x1b")
+    if not escapes:
+        return len(text)
+    known = 0
+    hidden = 0
+    for seq, length in _ANSI_SEQS:
+        count = text.count(seq)
+        known += count
+        hidden += count * length
+    if known == escapes:
+        return len(text) - hidden
     return len(ANSI_PATTERN.sub("", text))
 
 
-def _ljust_visible(text: str, width: int) -> str:
-    pad = max(width - _visible_len(text), 0)
-    return text + (" " * pad)
+_readline_history_path: Path | None = None
+
+
+def _enable_readline_history(history_path: Path) -> None:
+    # Fallback input() prompt: persistent history, no completion scan, no bell.
+    global _readline_history_path
+    if _readline_history_path == history_path:
+        return
+    try:
+        import readline
+    except Exception:  # pragma: no cover - readline is unavailable on Windows
+        return
+    readline.parse_and_bind("set bell-style none")
+    readline.set_completer(None)
+    readline.set_history_length(_HISTORY_LENGTH)
+    try:
+        readline.read_history_file(history_path)
+    except OSError:
+        pass
+    if _readline_history_path is None:
+        atexit.register(_save_readline_history)
+    _readline_history_path = history_path
+
+
+def _save_readline_history() -> None:
+    try:
+        import readline
+
+        readline.write_history_file(_readline_history_path)
+    except Exception:
+        pass
 
 
 def _batch_feature_enabled() -> bool:
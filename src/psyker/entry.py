@@ -5,11 +5,29 @@ from __future__ import annotations
 import argparse
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
 from . import __version__
-from .cli import create_default_cli
 from .sandbox import Sandbox
-from .update_check import start_async_update_check
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import threading
+
+    from .cli import PsykerCLI
+
+
+def create_default_cli(*, verbose: bool = False) -> "PsykerCLI":
+    # The CLI pulls in runtime, parser and subprocess; `psyker --version` never needs them.
+    from .cli import create_default_cli as _create_default_cli
+
+    return _create_default_cli(verbose=verbose)
+
+
+def start_async_update_check(current_version: str, notify: Callable[[str], None]) -> "threading.Thread":
+    # urllib/http.client are only imported when --check-updates is passed.
+    from .update_check import start_async_update_check as _start_async_update_check
+
+    return _start_async_update_check(current_version, notify)
 
 
 def _ensure_launch_working_directory(sandbox: Sandbox) -> None:
@@ -26,6 +26,8 @@ class PsykerError(Exception):
         self.hint = hint
 
     def to_diagnostic(self) -> str:
+        if self.span is None and not self.hint:
+            return f"error[{self.error_type}]: {self.message}"
         location = ""
         if self.span and self.span.path:
             location = f"\n  --> {self.span.path}:{self.span.line}:{self.span.column}"
@@ -3,21 +3,36 @@
 from __future__ import annotations
 
 from collections import deque
-from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-import shlex
-
-from PySide6.QtCore import QEasingCurve, QDir, QPoint, QPropertyAnimation, QSize, QTimer, Qt
-from PySide6.QtGui import QColor, QIcon, QLinearGradient, QPainter, QPen, QPixmap
+import time
+from typing import Callable
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QEasingCurve,
+    QDir,
+    QLine,
+    QModelIndex,
+    QObject,
+    QPropertyAnimation,
+    QSize,
+    QStringListModel,
+    QThread,
+    QTimer,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QBrush, QColor, QIcon, QLinearGradient, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
+    QApplication,
     QFileSystemModel,
     QFrame,
     QGraphicsDropShadowEffect,
     QGridLayout,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QSplitter,
     QTabWidget,
     QTreeView,
@@ -25,7 +40,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from ..cli import PsykerCLI, create_default_cli
+from ..cli import PsykerCLI, create_default_cli, split_command_line
 from .terminal import EmbeddedTerminal
 from .visuals import DecalOverlay, render_svg_icon
 
@@ -39,17 +54,26 @@ try:  # pragma: no cover - optional GUI dependency
 except Exception:  # pragma: no cover - optional GUI dependency
     pg = None
 
-try:  # pragma: no cover - optional GUI dependency
+try:  # pragma: no cover - optional GUI dependency (always present alongside pyqtgraph)
     import numpy as np
+except Exception:  # pragma: no cover - optional GUI dependency
+    np = None
+
+try:  # pragma: no cover - optional GUI dependency
     from vispy import app as vispy_app
     from vispy import scene
+    from vispy.visuals.transforms import STTransform
 except Exception:  # pragma: no cover - optional GUI dependency
-    np = None
     vispy_app = None
     scene = None
+    STTransform = None
 
 
 LOADABLE_SUFFIXES = {".psy", ".psya", ".psyw"}
+METRIC_HISTORY = 90
+METRIC_REDRAW_DELTA = 0.5
+METRIC_REDRAW_HEARTBEAT = 10
+_SCANLINE_TILE_WIDTH = 64
 
 THEMES: dict[str, dict[str, str]] = {
     "dark": {
@@ -85,6 +109,26 @@ THEMES: dict[str, dict[str, str]] = {
 }
 
 
+def _split_command_line(line: str) -> tuple[str, ...]:
+    # Same tokenizer (and shlex cache) as the CLI, so both sides agree on every line.
+    try:
+        return split_command_line(line)
+    except ValueError:
+        return ()
+
+
+@lru_cache(maxsize=None)
+def _plot_pens(theme: str) -> tuple[QPen, QPen, QPen, QPen]:
+    # Axis and curve pens only depend on the theme; build them once per theme.
+    colors = THEMES[theme]
+    return (
+        pg.mkPen(colors["border"]),
+        pg.mkPen(colors["muted"]),
+        pg.mkPen(colors["primary"], width=2),
+        pg.mkPen(colors["ram_plot"], width=2),
+    )
+
+
 class TronBackdrop(QWidget):
     """Animated cyberpunk background layer (VisPy when available, painter fallback otherwise)."""
 
@@ -92,6 +136,7 @@ class TronBackdrop(QWidget):
         super().__init__(parent)
         self._theme = theme if theme in THEMES else "dark"
         self._colors = THEMES[self._theme]
+        self._cache_theme_colors()
         self.setObjectName("TronBackdrop")
         self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
         self._phase = 0.0
@@ -100,6 +145,11 @@ class TronBackdrop(QWidget):
         self._vertical_density = 16
         self._horizontal_density = 20
         self._fallback_spacing = 32
+        self._fallback_lines: list[QLine] = []
+        self._fallback_lines_key: tuple[int, int, int] | None = None
+        self._grid_key: tuple[int, int, str] | None = None
+        self._fallback_gradient: QLinearGradient | None = None
+        self._fallback_gradient_key: tuple[int, int, str] | None = None
 
         self._timer = QTimer(self)
         self._timer.setInterval(90)
@@ -117,7 +167,10 @@ class TronBackdrop(QWidget):
                 self._view.camera.set_range(x=(-1.0, 1.0), y=(-1.0, 1.0))
                 self._view.camera.interactive = False
                 self._grid = scene.visuals.Line(parent=self._view.scene, width=1)
+                self._grid_rows = scene.visuals.Line(parent=self._view.scene, width=1)
+                self._grid_rows.transform = STTransform()
                 self._pulse = scene.visuals.Line(parent=self._view.scene, width=2)
+                self._pulse.transform = STTransform()
                 self._vispy_ready = True
                 self._update_vispy_frame()
             except Exception:
@@ -141,18 +194,30 @@ class TronBackdrop(QWidget):
     def set_theme(self, theme: str) -> None:
         self._theme = theme if theme in THEMES else "dark"
         self._colors = THEMES[self._theme]
+        self._cache_theme_colors()
         if self._vispy_ready:
             self._canvas.bgcolor = self._colors["bg"]
             self._update_vispy_frame()
         self.update()
 
+    def _cache_theme_colors(self) -> None:
+        # Per-frame paint/update paths reuse these instead of re-parsing theme hex strings.
+        primary = QColor(self._colors["primary"])
+        accent = QColor(self._colors["accent"])
+        self._grid_rgba = (primary.redF(), primary.greenF(), primary.blueF(), 0.04)
+        self._pulse_rgba = (accent.redF(), accent.greenF(), accent.blueF(), 0.16)
+        line_color = QColor(primary)
+        line_color.setAlpha(8)
+        self._fallback_pen = QPen(line_color, 1)
+
     def resizeEvent(self, event) -> None:  # noqa: ANN001 - Qt event
         super().resizeEvent(event)
         if self._vispy_ready:
             self._native.setGeometry(self.rect())
 
     def _tick(self) -> None:
-        if not self.isVisible():
+        # isVisible() stays true while the window is minimized; skip frames nobody sees.
+        if not self.isVisible() or self.window().isMinimized():
             return
         self._phase = (self._phase + self._phase_step) % 1.0
         if self._vispy_ready:
@@ -160,56 +225,67 @@ class TronBackdrop(QWidget):
         else:
             self.update()
 
+    def _upload_vispy_geometry(self) -> None:
+        # Vertices only change with density/theme; per-tick motion is a translate on rows and pulse.
+        columns, rows = self._vertical_density, self._horizontal_density
+        xs = np.linspace(-1.0, 1.0, columns, dtype=np.float32)
+        column_points = np.empty((2 * columns, 2), dtype=np.float32)
+        column_points[0::2, 0] = xs
+        column_points[1::2, 0] = xs
+        column_points[0::2, 1] = -1.0
+        column_points[1::2, 1] = 1.0
+
+        # Wrapped rows repeat every 2 / (rows - 1), so rows - 1 lines shifted by under one spacing fill the view.
+        row_count = max(rows - 1, 1)
+        self._row_spacing = 2.0 / row_count
+        ys = np.arange(row_count, dtype=np.float32) * self._row_spacing - 1.0
+        row_points = np.empty((2 * row_count, 2), dtype=np.float32)
+        row_points[0::2, 0] = -1.0
+        row_points[1::2, 0] = 1.0
+        row_points[0::2, 1] = ys
+        row_points[1::2, 1] = ys
+
+        self._grid.set_data(pos=column_points, connect="segments", color=self._grid_rgba)
+        self._grid_rows.set_data(pos=row_points, connect="segments", color=self._grid_rgba)
+        self._pulse.set_data(pos=np.array([[-1.0, 0.0], [1.0, 0.0]], dtype=np.float32), color=self._pulse_rgba)
+        self._grid_key = (columns, rows, self._theme)
+
     def _update_vispy_frame(self) -> None:
         if not self._vispy_ready or np is None:
             return
-        primary = QColor(self._colors["primary"])
-        accent = QColor(self._colors["accent"])
-        grid_color = (primary.redF(), primary.greenF(), primary.blueF(), 0.04)
-        pulse_color = (accent.redF(), accent.greenF(), accent.blueF(), 0.16)
-
-        vertical: list[list[float]] = []
-        for x in np.linspace(-1.0, 1.0, self._vertical_density):
-            vertical.append([float(x), -1.0])
-            vertical.append([float(x), 1.0])
-
-        horizontal: list[list[float]] = []
-        y_values = np.linspace(-1.0, 1.0, self._horizontal_density) + (self._phase * 0.35)
-        for y in y_values:
-            wrapped = ((float(y) + 1.0) % 2.0) - 1.0
-            horizontal.append([-1.0, wrapped])
-            horizontal.append([1.0, wrapped])
-
-        points = np.array(vertical + horizontal, dtype=np.float32)
-        connect = np.arange(len(points), dtype=np.int32).reshape(-1, 2)
-        self._grid.set_data(pos=points, connect=connect, color=grid_color)
-
-        pulse_y = -1.0 + (2.0 * self._phase)
-        pulse_points = np.array([[-1.0, pulse_y], [1.0, pulse_y]], dtype=np.float32)
-        self._pulse.set_data(pos=pulse_points, color=pulse_color)
+        if self._grid_key != (self._vertical_density, self._horizontal_density, self._theme):
+            self._upload_vispy_geometry()
+        self._grid_rows.transform.translate = (0.0, (self._phase * 0.35) % self._row_spacing)
+        self._pulse.transform.translate = (0.0, -1.0 + (2.0 * self._phase))
 
     def paintEvent(self, _event) -> None:  # noqa: ANN001 - Qt event
         if self._vispy_ready:
             return
         painter = QPainter(self)
-        grad = QLinearGradient(0, 0, self.width(), self.height())
-        if self._theme == "dark":
-            grad.setColorAt(0.0, QColor("#05080E"))
-            grad.setColorAt(0.55, QColor("#080E18"))
-            grad.setColorAt(1.0, QColor("#101A2B"))
-        else:
-            grad.setColorAt(0.0, QColor("#070C14"))
-            grad.setColorAt(0.55, QColor("#0C1321"))
-            grad.setColorAt(1.0, QColor("#15213A"))
-        painter.fillRect(self.rect(), grad)
-
-        line_color = QColor(self._colors["primary"])
-        line_color.setAlpha(8)
-        painter.setPen(QPen(line_color, 1))
-        spacing = self._fallback_spacing
-        offset = int(self._phase * spacing)
-        for x in range(-self.height(), self.width() + self.height(), spacing):
-            painter.drawLine(QPoint(x + offset, self.height()), QPoint(x + self.height() + offset, 0))
+        width, height, spacing = self.width(), self.height(), self._fallback_spacing
+        if self._fallback_gradient_key != (width, height, self._theme):
+            grad = QLinearGradient(0, 0, width, height)
+            if self._theme == "dark":
+                grad.setColorAt(0.0, QColor("#05080E"))
+                grad.setColorAt(0.55, QColor("#080E18"))
+                grad.setColorAt(1.0, QColor("#101A2B"))
+            else:
+                grad.setColorAt(0.0, QColor("#070C14"))
+                grad.setColorAt(0.55, QColor("#0C1321"))
+                grad.setColorAt(1.0, QColor("#15213A"))
+            self._fallback_gradient = grad
+            self._fallback_gradient_key = (width, height, self._theme)
+        painter.fillRect(self.rect(), self._fallback_gradient)
+
+        if self._fallback_lines_key != (width, height, spacing):
+            # Diagonals only change with geometry/spacing; animation is a translate per frame.
+            self._fallback_lines = [
+                QLine(x, height, x + height, 0) for x in range(-height, width + height, spacing)
+            ]
+            self._fallback_lines_key = (width, height, spacing)
+        painter.setPen(self._fallback_pen)
+        painter.translate(int(self._phase * spacing), 0)
+        painter.drawLines(self._fallback_lines)
 
 
 class HudFrame(QFrame):
@@ -217,46 +293,64 @@ class HudFrame(QFrame):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self._hud_colors = THEMES["dark"]
+        self._hud_geometry_key: tuple[int, int] | None = None
+        # Bypass subclass overrides; their widgets do not exist yet.
+        HudFrame.set_hud_theme(self, THEMES["dark"])
 
     def set_hud_theme(self, colors: dict[str, str]) -> None:
         self._hud_colors = colors
+        # Pens only change with the theme; paintEvent runs on every panel repaint.
+        border = QColor(colors["border"])
+        border.setAlpha(160)
+        inner_border = QColor(colors["primary"])
+        inner_border.setAlpha(70)
+        cyan = QColor(colors["primary"])
+        cyan.setAlpha(170)
+        magenta = QColor(colors["accent"])
+        magenta.setAlpha(165)
+        self._hud_border_pen = QPen(border, 1.0)
+        self._hud_inner_pen = QPen(inner_border, 1)
+        self._hud_cyan_pen = QPen(cyan, 1.4)
+        self._hud_magenta_pen = QPen(magenta, 1.4)
         self.update()
 
     def paintEvent(self, event) -> None:  # noqa: ANN001 - Qt event
         super().paintEvent(event)
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, True)
-        rect = self.rect().adjusted(1, 1, -2, -2)
+        if self._hud_geometry_key != (self.width(), self.height()):
+            self._build_hud_geometry()
 
-        border = QColor(self._hud_colors["border"])
-        border.setAlpha(160)
-        painter.setPen(QPen(border, 1.0))
-        painter.drawRoundedRect(rect, 8, 8)
+        painter.setPen(self._hud_border_pen)
+        painter.drawRoundedRect(self._hud_rect, 8, 8)
+        painter.setPen(self._hud_inner_pen)
+        painter.drawRoundedRect(self._hud_inner_rect, 6, 6)
 
-        inner = rect.adjusted(4, 4, -4, -4)
-        inner_border = QColor(self._hud_colors["primary"])
-        inner_border.setAlpha(70)
-        painter.setPen(QPen(inner_border, 1))
-        painter.drawRoundedRect(inner, 6, 6)
+        painter.setPen(self._hud_cyan_pen)
+        painter.drawLines(self._hud_cyan_segments)
+        painter.setPen(self._hud_magenta_pen)
+        painter.drawLines(self._hud_magenta_segments)
 
-        cyan = QColor(self._hud_colors["primary"])
-        cyan.setAlpha(170)
-        magenta = QColor(self._hud_colors["accent"])
-        magenta.setAlpha(165)
-        painter.setPen(QPen(cyan, 1.4))
+    def _build_hud_geometry(self) -> None:
+        # Frame rects and corner brackets only change with the widget size.
+        rect = self.rect().adjusted(1, 1, -2, -2)
+        left, top, right, bottom = rect.left(), rect.top(), rect.right(), rect.bottom()
         segment = 15
-        painter.drawLine(rect.left() + 8, rect.top() + 1, rect.left() + 8 + segment, rect.top() + 1)
-        painter.drawLine(rect.left() + 1, rect.top() + 8, rect.left() + 1, rect.top() + 8 + segment)
-        painter.setPen(QPen(magenta, 1.4))
-        painter.drawLine(rect.right() - 8 - segment, rect.top() + 1, rect.right() - 8, rect.top() + 1)
-        painter.drawLine(rect.right() - 1, rect.top() + 8, rect.right() - 1, rect.top() + 8 + segment)
-        painter.setPen(QPen(cyan, 1.4))
-        painter.drawLine(rect.left() + 1, rect.bottom() - 8 - segment, rect.left() + 1, rect.bottom() - 8)
-        painter.drawLine(rect.left() + 8, rect.bottom() - 1, rect.left() + 8 + segment, rect.bottom() - 1)
-        painter.setPen(QPen(magenta, 1.4))
-        painter.drawLine(rect.right() - 1, rect.bottom() - 8 - segment, rect.right() - 1, rect.bottom() - 8)
-        painter.drawLine(rect.right() - 8 - segment, rect.bottom() - 1, rect.right() - 8, rect.bottom() - 1)
+        self._hud_rect = rect
+        self._hud_inner_rect = rect.adjusted(4, 4, -4, -4)
+        self._hud_cyan_segments = [
+            QLine(left + 8, top + 1, left + 8 + segment, top + 1),
+            QLine(left + 1, top + 8, left + 1, top + 8 + segment),
+            QLine(left + 1, bottom - 8 - segment, left + 1, bottom - 8),
+            QLine(left + 8, bottom - 1, left + 8 + segment, bottom - 1),
+        ]
+        self._hud_magenta_segments = [
+            QLine(right - 8 - segment, top + 1, right - 8, top + 1),
+            QLine(right - 1, top + 8, right - 1, top + 8 + segment),
+            QLine(right - 1, bottom - 8 - segment, right - 1, bottom - 8),
+            QLine(right - 8 - segment, bottom - 1, right - 8, bottom - 1),
+        ]
+        self._hud_geometry_key = (self.width(), self.height())
 
 
 class TopContextBar(HudFrame):
@@ -265,6 +359,7 @@ class TopContextBar(HudFrame):
     def __init__(self, cli: PsykerCLI, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._cli = cli
+        self._refresh_key: tuple[Path, int] | None = None
         self.setObjectName("TopContextBar")
         self.setFrameShape(QFrame.StyledPanel)
         self.setFixedHeight(70)
@@ -320,6 +415,11 @@ class TopContextBar(HudFrame):
 
     def refresh(self) -> None:
         runtime = self._cli.runtime
+        # Labels only change when the sandbox moves or a load bumps the runtime version.
+        key = (runtime.sandbox.root, runtime.version)
+        if key == self._refresh_key:
+            return
+        self._refresh_key = key
         self._sandbox.setText(str(runtime.sandbox.root))
         self._count_values["agents"].setText(f"{len(runtime.agents):02d}")
         self._count_values["workers"].setText(f"{len(runtime.workers):02d}")
@@ -345,6 +445,107 @@ class TopContextBar(HudFrame):
                 label.setPixmap(pixmap)
 
 
+class MetricsSampler(QObject):
+    """Polls psutil on a worker thread and emits (cpu %, ram %) samples."""
+
+    sampled = Signal(float, float)
+    stop_requested = Signal()
+
+    def __init__(self, interval_ms: int = 1000) -> None:
+        super().__init__()
+        self._interval_ms = interval_ms
+        self._timer: QTimer | None = None
+        self._next_deadline = 0.0
+        self.stop_requested.connect(self._stop)
+
+    def start(self) -> None:
+        # Runs in the worker thread, so the timer is owned by (and fires on) that thread.
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._sample)
+        self._next_deadline = time.monotonic()
+        self._sample()
+
+    def _sample(self) -> None:
+        self.sampled.emit(psutil.cpu_percent(interval=None), psutil.virtual_memory().percent)
+        # Re-arm against a fixed deadline grid so wakeup jitter does not accumulate.
+        now = time.monotonic()
+        self._next_deadline += self._interval_ms / 1000.0
+        if self._next_deadline < now:
+            self._next_deadline = now + self._interval_ms / 1000.0
+        self._timer.start(int((self._next_deadline - now) * 1000))
+
+    def _stop(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+        QThread.currentThread().quit()
+
+
+def _stop_metrics_thread(thread: QThread, sampler: MetricsSampler) -> None:
+    if not thread.isRunning():
+        return
+    sampler.stop_requested.emit()
+    thread.wait(2000)
+
+
+def _release_metrics_thread(app: QApplication | None, stop: Callable[[], None], *_args: object) -> None:
+    # The owning panel is gone: stop its sampler thread before it can be collected while running.
+    if app is not None:
+        try:
+            app.aboutToQuit.disconnect(stop)
+        except RuntimeError:  # the application object is already gone
+            pass
+    stop()
+
+
+class CommandProgressModel(QAbstractListModel):
+    """Most-recent-first run history; inserts and evicts touch only the affected rows."""
+
+    def __init__(self, alert_color: str, limit: int = 20, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._rows: deque[tuple[str, bool]] = deque(maxlen=limit)
+        self._alert = QColor(alert_color)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008 - Qt default index
+        if parent.isValid():
+            return 0
+        return len(self._rows) or 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):  # noqa: ANN201 - Qt variant
+        if not index.isValid():
+            return None
+        if not self._rows:
+            return "No task runs yet" if role == Qt.ItemDataRole.DisplayRole else None
+        text, failed = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return text
+        if role == Qt.ItemDataRole.ForegroundRole and failed:
+            return self._alert
+        return None
+
+    def prepend(self, text: str, failed: bool) -> None:
+        if not self._rows:
+            # Replace the placeholder row in place.
+            self._rows.append((text, failed))
+            first = self.index(0)
+            self.dataChanged.emit(first, first)
+            return
+        if len(self._rows) == self._rows.maxlen:
+            last = len(self._rows) - 1
+            self.beginRemoveRows(QModelIndex(), last, last)
+            self._rows.pop()
+            self.endRemoveRows()
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.appendleft((text, failed))
+        self.endInsertRows()
+
+    def set_alert_color(self, alert_color: str) -> None:
+        self._alert = QColor(alert_color)
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1), [Qt.ItemDataRole.ForegroundRole])
+
+
 class RightMonitorPanel(HudFrame):
     """Monitor panel with metrics and runtime lists."""
 
@@ -357,8 +558,14 @@ class RightMonitorPanel(HudFrame):
         self.setFrameShape(QFrame.StyledPanel)
         self.set_hud_theme(self._colors)
 
-        self._cpu_series: deque[float] = deque([0.0] * 90, maxlen=90)
-        self._ram_series: deque[float] = deque([0.0] * 90, maxlen=90)
+        # Fixed-size float arrays shifted in place; pyqtgraph plots them without list conversion.
+        self._metric_x = np.arange(METRIC_HISTORY, dtype=np.float32) if np is not None else None
+        # NaN marks "no sample yet"; curves use connect="finite" so those slots are not drawn.
+        self._cpu_series = np.full(METRIC_HISTORY, np.nan, dtype=np.float32) if np is not None else None
+        self._ram_series = np.full(METRIC_HISTORY, np.nan, dtype=np.float32) if np is not None else None
+        self._plotted_cpu = float("nan")
+        self._plotted_ram = float("nan")
+        self._metric_ticks_since_plot = 0
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
@@ -382,25 +589,44 @@ class RightMonitorPanel(HudFrame):
         layout.addWidget(self._tabs, 1)
         self._tab_icon_names = ["cpu", "agents", "workers", "tasks", "progress"]
 
-        self._agents_list = QListWidget()
-        self._workers_list = QListWidget()
-        self._tasks_list = QListWidget()
-        self._progress_list = QListWidget()
+        self._agents_list, self._agents_model = self._build_string_list()
+        self._workers_list, self._workers_model = self._build_string_list()
+        self._tasks_list, self._tasks_model = self._build_string_list()
+        self._progress_model = CommandProgressModel(self._colors["alert"], parent=self)
+        self._progress_list = QListView()
+        self._progress_list.setModel(self._progress_model)
 
-        self._tabs.addTab(self._build_metrics_tab(), "CPU/GPU")
+        self._metrics_tab_index = self._tabs.addTab(self._build_metrics_tab(), "CPU/GPU")
         self._tabs.addTab(self._build_list_tab(self._agents_list), "Agents")
         self._tabs.addTab(self._build_list_tab(self._workers_list), "Workers")
         self._tabs.addTab(self._build_list_tab(self._tasks_list), "Tasks")
         self._tabs.addTab(self._build_list_tab(self._progress_list), "Task progress")
-        self._progress_list.addItem("No task runs yet")
-
-        self._timer: QTimer | None = None
+        # Runtime list tabs are rebuilt only when shown and only if the runtime changed since.
+        self._runtime_list_tabs = {
+            1: ("agents", self._agents_model),
+            2: ("workers", self._workers_model),
+            3: ("tasks", self._tasks_model),
+        }
+        self._list_tab_versions: dict[int, int] = {}
+        self._tabs.currentChanged.connect(self._on_tab_changed)
+
+        # psutil polling runs on its own thread; the GUI thread only applies samples.
+        self._metrics_thread: QThread | None = None
+        self._metrics_sampler: MetricsSampler | None = None
         if psutil is not None:
-            self._timer = QTimer(self)
-            self._timer.setInterval(1000)
-            self._timer.timeout.connect(self._update_metrics)
-            self._timer.start()
-            self._update_metrics()
+            self._metrics_sampler = MetricsSampler(interval_ms=1000)
+            self._metrics_thread = QThread()
+            self._metrics_sampler.moveToThread(self._metrics_thread)
+            self._metrics_sampler.sampled.connect(self._update_metrics, Qt.ConnectionType.QueuedConnection)
+            self._metrics_thread.started.connect(self._metrics_sampler.start)
+            self._metrics_thread.start(QThread.Priority.LowPriority)
+            # Plain callables rather than bound methods: the connections must not keep a closed
+            # panel alive, and destroyed fires while Qt is already tearing this widget down.
+            stop = partial(_stop_metrics_thread, self._metrics_thread, self._metrics_sampler)
+            app = QApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(stop)
+            self.destroyed.connect(partial(_release_metrics_thread, app, stop))
 
         self.refresh_runtime_lists()
         self._apply_plot_theme()
@@ -429,6 +655,7 @@ class RightMonitorPanel(HudFrame):
 
         self._cpu_value = QLabel("--.-%")
         self._ram_value = QLabel("--.-%")
+        self._cpu_text = self._ram_text = "--.-%"
         self._gpu_value = QLabel("N/A")
         self._cpu_value.setObjectName("MetricValue")
         self._ram_value.setObjectName("MetricValue")
@@ -446,95 +673,156 @@ class RightMonitorPanel(HudFrame):
         grid.setColumnStretch(1, 1)
         layout.addLayout(grid)
 
+        self._plot = None
+        self._cpu_curve = None
+        self._ram_curve = None
+        self._plot_layout: QVBoxLayout | None = None
         if pg is None or psutil is None:
             fallback = QLabel("Install pyqtgraph + psutil for live metrics.")
             fallback.setObjectName("MetricFallback")
             fallback.setWordWrap(True)
             layout.addWidget(fallback)
             layout.addStretch(1)
-            self._plot = None
-            self._cpu_curve = None
-            self._ram_curve = None
             return widget
 
+        # The plot itself is built after the panel is first shown (see showEvent).
+        self._plot_layout = layout
+        return widget
+
+    def showEvent(self, event) -> None:  # noqa: ANN001 - Qt event
+        super().showEvent(event)
+        if self._plot is None and self._plot_layout is not None:
+            # Let the window paint its first frame before paying for pyqtgraph setup.
+            QTimer.singleShot(0, self._build_plot)
+
+    def _build_plot(self) -> None:
+        if self._plot is not None or self._plot_layout is None:
+            return
         plot = pg.PlotWidget()
         plot.setObjectName("MetricsPlot")
         plot.setBackground(self._colors["input_bg"])
         plot.showGrid(x=True, y=True, alpha=0.12)
         plot.setYRange(0, 100)
+        plot.setXRange(0, METRIC_HISTORY - 1, padding=0)
+        # Both axes are fixed, so setData need not trigger an auto-range pass per curve.
+        plot.disableAutoRange()
         plot.setMouseEnabled(False, False)
         plot.hideButtons()
         plot.setMenuEnabled(False)
-        plot.getAxis("left").setPen(pg.mkPen(self._colors["border"]))
-        plot.getAxis("bottom").setPen(pg.mkPen(self._colors["border"]))
-        plot.getAxis("left").setTextPen(pg.mkPen(self._colors["muted"]))
-        plot.getAxis("bottom").setTextPen(pg.mkPen(self._colors["muted"]))
         plot.setLabel("left", "%")
         plot.setLabel("bottom", "s")
 
-        self._cpu_curve = plot.plot(pen=pg.mkPen(self._colors["primary"], width=2))
-        self._ram_curve = plot.plot(pen=pg.mkPen(self._colors["ram_plot"], width=2))
+        self._cpu_curve = plot.plot(connect="finite")
+        self._ram_curve = plot.plot(connect="finite")
         self._plot = plot
-        layout.addWidget(plot, 1)
-        return widget
+        self._apply_plot_theme()
+        self._plot_layout.addWidget(plot, 1)
+        # Samples collected before the plot existed are drawn right away.
+        self._redraw_metrics()
+
+    def _build_string_list(self) -> tuple[QListView, QStringListModel]:
+        model = QStringListModel(self)
+        view = QListView()
+        view.setModel(model)
+        return view, model
 
-    def _build_list_tab(self, list_widget: QListWidget) -> QWidget:
+    def _build_list_tab(self, list_widget: QListView) -> QWidget:
         list_widget.setObjectName("MonitorList")
         list_widget.setAlternatingRowColors(True)
+        # Rows are single-line monospace text; skip per-row sizeHint queries on layout.
+        list_widget.setUniformItemSizes(True)
         wrapper = QWidget()
         layout = QVBoxLayout(wrapper)
         layout.setContentsMargins(8, 8, 8, 8)
         layout.addWidget(list_widget)
         return wrapper
 
-    def _update_metrics(self) -> None:
-        if psutil is None:
+    def _update_metrics(self, cpu: float, ram: float) -> None:
+        cpu_text = f"{cpu:6.1f}%"
+        if cpu_text != self._cpu_text:
+            self._cpu_text = cpu_text
+            self._cpu_value.setText(cpu_text)
+        ram_text = f"{ram:6.1f}%"
+        if ram_text != self._ram_text:
+            self._ram_text = ram_text
+            self._ram_value.setText(ram_text)
+
+        if self._cpu_series is None:
+            return
+        self._cpu_series[:-1] = self._cpu_series[1:]
+        self._cpu_series[-1] = cpu
+        self._ram_series[:-1] = self._ram_series[1:]
+        self._ram_series[-1] = ram
+        # History keeps growing while hidden; the plot catches up when its tab is shown.
+        if self._plot is None or not self._plot.isVisible():
+            return
+        if self.window().isMinimized():
+            # Force a catch-up redraw on the first sample after the window is restored.
+            self._metric_ticks_since_plot = METRIC_REDRAW_HEARTBEAT
             return
-        cpu = psutil.cpu_percent(interval=None)
-        ram = psutil.virtual_memory().percent
-        self._cpu_value.setText(f"{cpu:6.1f}%")
-        self._ram_value.setText(f"{ram:6.1f}%")
 
-        self._cpu_series.append(cpu)
-        self._ram_series.append(ram)
+        # Flat readings look the same one tick later; redraw on change or on the heartbeat.
+        self._metric_ticks_since_plot += 1
+        if (
+            abs(cpu - self._plotted_cpu) < METRIC_REDRAW_DELTA
+            and abs(ram - self._plotted_ram) < METRIC_REDRAW_DELTA
+            and self._metric_ticks_since_plot < METRIC_REDRAW_HEARTBEAT
+        ):
+            return
+        self._redraw_metrics()
 
-        if self._cpu_curve is not None and self._ram_curve is not None:
-            x_data = list(range(len(self._cpu_series)))
-            self._cpu_curve.setData(x_data, list(self._cpu_series))
-            self._ram_curve.setData(x_data, list(self._ram_series))
+    def _redraw_metrics(self) -> None:
+        if self._cpu_curve is None or self._ram_curve is None or self._cpu_series is None:
+            return
+        self._plotted_cpu = float(self._cpu_series[-1])
+        self._plotted_ram = float(self._ram_series[-1])
+        self._metric_ticks_since_plot = 0
+        self._cpu_curve.setData(self._metric_x, self._cpu_series)
+        self._ram_curve.setData(self._metric_x, self._ram_series)
+
+    def _on_tab_changed(self, index: int) -> None:
+        if index == self._metrics_tab_index:
+            self._redraw_metrics()
+        else:
+            self._refresh_current_list(index)
 
     def refresh_runtime_lists(self) -> None:
-        self._populate_named_list(self._agents_list, sorted(self._cli.runtime.agents.keys()))
-        self._populate_named_list(self._workers_list, sorted(self._cli.runtime.workers.keys()))
-        self._populate_named_list(self._tasks_list, sorted(self._cli.runtime.tasks.keys()))
+        self._refresh_current_list(self._tabs.currentIndex())
+
+    def _refresh_current_list(self, index: int) -> None:
+        entry = self._runtime_list_tabs.get(index)
+        if entry is None:
+            return
+        version = self._cli.runtime.version
+        if self._list_tab_versions.get(index) == version:
+            return
+        kind, target = entry
+        self._populate_named_list(target, sorted(getattr(self._cli.runtime, kind)))
+        self._list_tab_versions[index] = version
 
     def record_command_result(self, line: str, exit_code: int) -> None:
         verb, args = self._split_line(line)
         if verb != "run" or len(args) < 2:
             return
-        stamp = datetime.now().strftime("%H:%M:%S")
+        now = time.localtime()
+        stamp = f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
         state = "OK" if exit_code == 0 else f"FAIL {exit_code}"
         row = f"{stamp}  {state:<7} {args[0]}/{args[1]}"
-        item = QListWidgetItem(row)
-        if exit_code != 0:
-            item.setForeground(QColor(self._colors["alert"]))
-        self._progress_list.insertItem(0, item)
-        while self._progress_list.count() > 20:
-            self._progress_list.takeItem(self._progress_list.count() - 1)
-
-    def _populate_named_list(self, target: QListWidget, names: list[str]) -> None:
-        target.clear()
+        self._progress_model.prepend(row, exit_code != 0)
+
+    def _populate_named_list(self, target: QStringListModel, names: list[str]) -> None:
+        # One model reset for the whole list instead of an item allocation per row.
         if not names:
-            target.addItem("(none)")
+            target.setStringList(["(none)"])
             return
-        width = max(len(name) for name in names)
-        for idx, name in enumerate(names, start=1):
-            target.addItem(f"{idx:>2} | {name:<{width}}")
+        width = max(map(len, names))
+        target.setStringList([f"{idx:>2} | {name:<{width}}" for idx, name in enumerate(names, start=1)])
 
     def set_theme(self, theme: str) -> None:
         self._theme = theme if theme in THEMES else "dark"
         self._colors = THEMES[self._theme]
         self.set_hud_theme(self._colors)
+        self._progress_model.set_alert_color(self._colors["alert"])
         self._apply_icons()
         self._apply_plot_theme()
 
@@ -555,25 +843,23 @@ class RightMonitorPanel(HudFrame):
     def _apply_plot_theme(self) -> None:
         if pg is None or self._plot is None:
             return
+        border_pen, text_pen, cpu_pen, ram_pen = _plot_pens(self._theme)
         self._plot.setBackground(self._colors["input_bg"])
-        self._plot.getAxis("left").setPen(pg.mkPen(self._colors["border"]))
-        self._plot.getAxis("bottom").setPen(pg.mkPen(self._colors["border"]))
-        self._plot.getAxis("left").setTextPen(pg.mkPen(self._colors["muted"]))
-        self._plot.getAxis("bottom").setTextPen(pg.mkPen(self._colors["muted"]))
+        self._plot.getAxis("left").setPen(border_pen)
+        self._plot.getAxis("bottom").setPen(border_pen)
+        self._plot.getAxis("left").setTextPen(text_pen)
+        self._plot.getAxis("bottom").setTextPen(text_pen)
         if self._cpu_curve is not None:
-            self._cpu_curve.setPen(pg.mkPen(self._colors["primary"], width=2))
+            self._cpu_curve.setPen(cpu_pen)
         if self._ram_curve is not None:
-            self._ram_curve.setPen(pg.mkPen(self._colors["ram_plot"], width=2))
+            self._ram_curve.setPen(ram_pen)
 
     @staticmethod
     def _split_line(line: str) -> tuple[str, list[str]]:
-        try:
-            parts = shlex.split(line)
-        except ValueError:
-            return "", []
+        parts = _split_command_line(line)
         if not parts:
             return "", []
-        return parts[0], parts[1:]
+        return parts[0], list(parts[1:])
 
 
 class BottomFileExplorer(HudFrame):
@@ -608,6 +894,8 @@ class BottomFileExplorer(HudFrame):
         layout.addWidget(self._root_label)
 
         self._model = QFileSystemModel(self)
+        # Skip per-folder desktop.ini/custom icon lookups while the gatherer walks the workspace.
+        self._model.setOption(QFileSystemModel.Option.DontUseCustomDirectoryIcons, True)
         self._tree = QTreeView(self)
         self._tree.setObjectName("ExplorerTree")
         self._tree.setModel(self._model)
@@ -618,10 +906,13 @@ class BottomFileExplorer(HudFrame):
         self._tree.doubleClicked.connect(self._on_double_clicked)
         self._tree.setHeaderHidden(False)
         self._tree.setColumnWidth(0, 360)
+        # Only names are shown; size/type/modified cells would be formatted for every visible row.
+        for column in (1, 2, 3):
+            self._tree.setColumnHidden(column, True)
         layout.addWidget(self._tree, 1)
 
+        # QFileSystemModel handles live updates from filesystem watchers.
         self._model.setFilter(QDir.AllDirs | QDir.NoDotAndDotDot | QDir.Files)
-        self._model.setNameFilters(["*"])  # QFileSystemModel handles live updates from filesystem watchers.
         self._model.setNameFilterDisables(False)
         self.refresh_root(force=True)
         self._apply_icon()
@@ -667,13 +958,13 @@ class ScanlineOverlay(QWidget):
         self._theme = theme if theme in THEMES else "dark"
         self._line_spacing = 4
         self._line_alpha = 8
-        self._cache: QPixmap | None = None
+        self._brush: QBrush | None = None
         self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
         self.setAttribute(Qt.WA_NoSystemBackground, True)
 
     def set_theme(self, theme: str) -> None:
         self._theme = theme if theme in THEMES else "dark"
-        self._cache = None
+        self._brush = None
         self.update()
 
     def set_performance_profile(self, fullscreen_mode: bool) -> None:
@@ -683,38 +974,27 @@ class ScanlineOverlay(QWidget):
         else:
             self._line_spacing = 4
             self._line_alpha = 8
-        self._cache = None
+        self._brush = None
         self.update()
 
-    def resizeEvent(self, event) -> None:  # noqa: ANN001 - Qt event type
-        super().resizeEvent(event)
-        self._cache = None
-
-    def _build_cache(self) -> None:
-        if self.width() <= 0 or self.height() <= 0:
-            self._cache = None
-            return
-        pixmap = QPixmap(self.size())
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing, False)
+    def _build_brush(self) -> None:
+        # One scanline period as a tile; the brush repeats it, so resizes need no rebuild.
+        tile = QPixmap(_SCANLINE_TILE_WIDTH, self._line_spacing)
+        tile.fill(Qt.GlobalColor.transparent)
         if self._theme == "light":
             color = QColor(47, 216, 255, max(1, self._line_alpha - 1))
         else:
             color = QColor(47, 216, 255, self._line_alpha)
-        painter.setPen(color)
-        for y in range(0, self.height(), self._line_spacing):
-            painter.drawLine(QPoint(0, y), QPoint(self.width(), y))
+        painter = QPainter(tile)
+        painter.fillRect(0, 0, _SCANLINE_TILE_WIDTH, 1, color)
         painter.end()
-        self._cache = pixmap
+        self._brush = QBrush(tile)
 
-    def paintEvent(self, _event) -> None:  # noqa: ANN001 - Qt event type
-        if self._cache is None or self._cache.size() != self.size():
-            self._build_cache()
-        if self._cache is None:
-            return
+    def paintEvent(self, event) -> None:  # noqa: ANN001 - Qt event type
+        if self._brush is None:
+            self._build_brush()
         painter = QPainter(self)
-        painter.drawPixmap(0, 0, self._cache)
+        painter.fillRect(event.rect(), self._brush)
 
 
 class PsykerDashboard(QWidget):
@@ -728,6 +1008,7 @@ class PsykerDashboard(QWidget):
         self._fullscreen_perf_mode = False
         self._intro_animations: list[QPropertyAnimation] = []
         self._panel_effects: list[QGraphicsDropShadowEffect] = []
+        self._applied_stylesheet: str | None = None
 
         self._backdrop = TronBackdrop(theme=self._theme, parent=self)
         self._decals = DecalOverlay(theme=self._theme, parent=self)
@@ -765,6 +1046,12 @@ class PsykerDashboard(QWidget):
         self._backdrop.stackUnder(self._decals)
         self._install_panel_glow()
 
+        # load/sandbox bursts (e.g. a script of loads) coalesce into one panel rebuild.
+        self._panel_refresh_timer = QTimer(self)
+        self._panel_refresh_timer.setSingleShot(True)
+        self._panel_refresh_timer.setInterval(150)
+        self._panel_refresh_timer.timeout.connect(self._refresh_panels)
+
         self._terminal.commandExecuted.connect(self._on_command_executed)
         self.set_theme(self._theme)
         self._update_performance_profile(force=True)
@@ -780,8 +1067,8 @@ class PsykerDashboard(QWidget):
 
     def _on_command_executed(self, line: str, code: int) -> None:
         self._monitor.record_command_result(line, code)
-        if self._command_requires_runtime_refresh(line):
-            self._refresh_panels()
+        if self._command_requires_runtime_refresh(line) and not self._panel_refresh_timer.isActive():
+            self._panel_refresh_timer.start()
 
     def _refresh_panels(self) -> None:
         self._top.refresh()
@@ -822,246 +1109,17 @@ class PsykerDashboard(QWidget):
 
     @staticmethod
     def _command_requires_runtime_refresh(line: str) -> bool:
-        try:
-            parts = shlex.split(line)
-        except ValueError:
-            return False
+        parts = _split_command_line(line)
         if not parts:
             return False
         return parts[0] in {"load", "sandbox"}
 
     def _apply_styles(self) -> None:
-        colors = THEMES[self._theme]
-        dark_mode = self._theme == "dark"
-        panel_rgba = "rgba(11, 15, 26, 235)" if dark_mode else "rgba(16, 22, 37, 236)"
-        input_rgba = "rgba(18, 26, 42, 233)" if dark_mode else "rgba(22, 32, 51, 236)"
-        border_rgba = "rgba(30, 44, 68, 175)" if dark_mode else "rgba(36, 55, 88, 185)"
-        list_alt_rgba = "rgba(12, 19, 33, 236)" if dark_mode else "rgba(14, 24, 39, 238)"
-        cyan_glow_rgba = "rgba(47, 216, 255, 112)" if dark_mode else "rgba(47, 216, 255, 122)"
-        magenta_glow_rgba = "rgba(230, 76, 255, 110)" if dark_mode else "rgba(155, 92, 255, 120)"
-        cyan_wash_rgba = "rgba(47, 216, 255, 44)" if dark_mode else "rgba(47, 216, 255, 52)"
-        panel_grad = (
-            f"qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {panel_rgba}, stop:1 {input_rgba})"
-        )
-        self.setStyleSheet(
-            f"""
-            QWidget#PsykerDashboard {{
-                background-color: transparent;
-                color: {colors['text']};
-                font-family: 'Segoe UI', 'Noto Sans', sans-serif;
-                font-size: 13px;
-            }}
-            QFrame#TopContextBar, QFrame#RightMonitorPanel, QFrame#BottomFileExplorer {{
-                background: {panel_grad};
-                border: 1px solid {border_rgba};
-                border-radius: 9px;
-            }}
-            QLabel#ContextTitle {{
-                color: {colors['primary']};
-                font-weight: 700;
-                letter-spacing: 1px;
-                padding-bottom: 1px;
-                border-bottom: 1px solid {cyan_glow_rgba};
-            }}
-            QLabel#ContextIcon, QLabel#ContextCounterIcon {{
-                min-width: 14px;
-                max-width: 14px;
-                min-height: 14px;
-                max-height: 14px;
-            }}
-            QLabel#ContextSandboxLabel {{
-                color: {colors['primary']};
-                font-weight: 700;
-                letter-spacing: 0.9px;
-            }}
-            QLabel#ContextSandbox {{
-                color: {colors['text']};
-                font-size: 12px;
-            }}
-            QFrame#ContextCounter {{
-                border: 1px solid {border_rgba};
-                border-radius: 7px;
-                background: {input_rgba};
-            }}
-            QFrame#ContextCounter:hover {{
-                border: 1px solid {cyan_glow_rgba};
-            }}
-            QLabel#ContextCounterLabel {{
-                color: {colors['muted']};
-                font-size: 11px;
-            }}
-            QLabel#ContextCounterValue {{
-                color: {colors['primary']};
-                font-weight: 700;
-                font-size: 12px;
-            }}
-            QLabel#PanelTitle {{
-                color: {colors['primary']};
-                font-weight: 700;
-                letter-spacing: 1px;
-                padding-bottom: 1px;
-                border-bottom: 1px solid {cyan_glow_rgba};
-            }}
-            QLabel#PanelIcon {{
-                min-width: 14px;
-                max-width: 14px;
-                min-height: 14px;
-                max-height: 14px;
-            }}
-            QLabel#ExplorerRoot {{
-                color: {colors['muted']};
-                font-size: 12px;
-            }}
-            QLabel#MetricHeader {{
-                color: {colors['muted']};
-                font-size: 11px;
-                font-weight: 600;
-                letter-spacing: 0.8px;
-            }}
-            QTabWidget#MonitorTabs::pane {{
-                border: 1px solid {border_rgba};
-                background: {input_rgba};
-                top: -1px;
-                border-radius: 8px;
-            }}
-            QTabBar::tab {{
-                background: {panel_rgba};
-                color: {colors['muted']};
-                padding: 6px 10px;
-                border: 1px solid {border_rgba};
-                border-bottom: 1px solid {border_rgba};
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                margin-right: 2px;
-            }}
-            QTabBar::tab:hover {{
-                color: {colors['primary']};
-                border-color: {cyan_glow_rgba};
-            }}
-            QTabBar::tab:selected {{
-                color: {colors['primary']};
-                background: {cyan_wash_rgba};
-                border-color: {cyan_glow_rgba};
-                border-bottom: 2px solid {colors['primary']};
-            }}
-            QListWidget#MonitorList {{
-                border: 1px solid {border_rgba};
-                background: {input_rgba};
-                padding: 4px;
-                outline: none;
-                font-family: Consolas, 'JetBrains Mono', monospace;
-                font-size: 12px;
-            }}
-            QListWidget#MonitorList:focus {{
-                border: 1px solid {cyan_glow_rgba};
-            }}
-            QListWidget#MonitorList::item {{
-                min-height: 20px;
-                padding: 2px 6px;
-            }}
-            QListWidget#MonitorList::item:selected {{
-                background: {colors['selected_bg']};
-                border: 1px solid {magenta_glow_rgba};
-                color: {colors['primary']};
-            }}
-            QLabel#MetricLabel {{
-                color: {colors['primary']};
-                font-weight: 700;
-                font-size: 12px;
-            }}
-            QLabel#MetricValue {{
-                color: {colors['text']};
-                font-family: Consolas, 'JetBrains Mono', monospace;
-                font-size: 12px;
-            }}
-            QLabel#MetricFallback {{
-                color: {colors['muted']};
-            }}
-            QTreeView#ExplorerTree {{
-                border: 1px solid {border_rgba};
-                background: {input_rgba};
-                alternate-background-color: {list_alt_rgba};
-                padding: 4px;
-                outline: none;
-                font-family: Consolas, 'JetBrains Mono', monospace;
-                font-size: 12px;
-            }}
-            QTreeView#ExplorerTree:focus {{
-                border: 1px solid {cyan_glow_rgba};
-            }}
-            QTreeView#ExplorerTree::item {{
-                min-height: 20px;
-                padding: 2px 6px;
-            }}
-            QTreeView#ExplorerTree::item:selected {{
-                background: {colors['selected_bg']};
-                border: 1px solid {magenta_glow_rgba};
-                color: {colors['primary']};
-            }}
-            QHeaderView::section {{
-                background: {panel_rgba};
-                color: {colors['muted']};
-                padding: 4px 6px;
-                border: 1px solid {border_rgba};
-                border-top: none;
-                border-left: none;
-                font-size: 11px;
-                letter-spacing: 0.5px;
-            }}
-            QScrollBar:vertical {{
-                background: {input_rgba};
-                width: 8px;
-                margin: 2px;
-                border-radius: 4px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {colors['primary']};
-                min-height: 22px;
-                border-radius: 4px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: {colors['focus']};
-            }}
-            QScrollBar::handle:vertical:pressed {{
-                background: {colors['accent']};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: transparent;
-            }}
-            QScrollBar:horizontal {{
-                background: {input_rgba};
-                height: 8px;
-                margin: 2px;
-                border-radius: 4px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background: {colors['primary']};
-                min-width: 22px;
-                border-radius: 4px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background: {colors['focus']};
-            }}
-            QScrollBar::handle:horizontal:pressed {{
-                background: {colors['accent']};
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                width: 0px;
-            }}
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
-                background: transparent;
-            }}
-            QSplitter::handle {{
-                background: {border_rgba};
-            }}
-            QSplitter::handle:hover {{
-                background: {cyan_glow_rgba};
-            }}
-            """
-        )
+        stylesheet = _dashboard_stylesheet(self._theme)
+        if stylesheet is self._applied_stylesheet:
+            return
+        self.setStyleSheet(stylesheet)
+        self._applied_stylesheet = stylesheet
 
     def _install_panel_glow(self) -> None:
         self._panel_effects.clear()
@@ -1084,3 +1142,239 @@ class PsykerDashboard(QWidget):
             glow.setEasingCurve(QEasingCurve.OutCubic)
             glow.start()
             self._intro_animations.append(glow)
+
+
+@lru_cache(maxsize=None)
+def _dashboard_stylesheet(theme: str) -> str:
+    # Built once per theme; re-applying an identical sheet would still re-polish every child widget.
+    colors = THEMES[theme]
+    dark_mode = theme == "dark"
+    panel_rgba = "rgba(11, 15, 26, 235)" if dark_mode else "rgba(16, 22, 37, 236)"
+    input_rgba = "rgba(18, 26, 42, 233)" if dark_mode else "rgba(22, 32, 51, 236)"
+    border_rgba = "rgba(30, 44, 68, 175)" if dark_mode else "rgba(36, 55, 88, 185)"
+    list_alt_rgba = "rgba(12, 19, 33, 236)" if dark_mode else "rgba(14, 24, 39, 238)"
+    cyan_glow_rgba = "rgba(47, 216, 255, 112)" if dark_mode else "rgba(47, 216, 255, 122)"
+    magenta_glow_rgba = "rgba(230, 76, 255, 110)" if dark_mode else "rgba(155, 92, 255, 120)"
+    cyan_wash_rgba = "rgba(47, 216, 255, 44)" if dark_mode else "rgba(47, 216, 255, 52)"
+    panel_grad = (
+        f"qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {panel_rgba}, stop:1 {input_rgba})"
+    )
+    return (
+        f"""
+        QWidget#PsykerDashboard {{
+            background-color: transparent;
+            color: {colors['text']};
+            font-family: 'Segoe UI', 'Noto Sans', sans-serif;
+            font-size: 13px;
+        }}
+        QFrame#TopContextBar, QFrame#RightMonitorPanel, QFrame#BottomFileExplorer {{
+            background: {panel_grad};
+            border: 1px solid {border_rgba};
+            border-radius: 9px;
+        }}
+        QLabel#ContextTitle {{
+            color: {colors['primary']};
+            font-weight: 700;
+            letter-spacing: 1px;
+            padding-bottom: 1px;
+            border-bottom: 1px solid {cyan_glow_rgba};
+        }}
+        QLabel#ContextIcon, QLabel#ContextCounterIcon {{
+            min-width: 14px;
+            max-width: 14px;
+            min-height: 14px;
+            max-height: 14px;
+        }}
+        QLabel#ContextSandboxLabel {{
+            color: {colors['primary']};
+            font-weight: 700;
+            letter-spacing: 0.9px;
+        }}
+        QLabel#ContextSandbox {{
+            color: {colors['text']};
+            font-size: 12px;
+        }}
+        QFrame#ContextCounter {{
+            border: 1px solid {border_rgba};
+            border-radius: 7px;
+            background: {input_rgba};
+        }}
+        QFrame#ContextCounter:hover {{
+            border: 1px solid {cyan_glow_rgba};
+        }}
+        QLabel#ContextCounterLabel {{
+            color: {colors['muted']};
+            font-size: 11px;
+        }}
+        QLabel#ContextCounterValue {{
+            color: {colors['primary']};
+            font-weight: 700;
+            font-size: 12px;
+        }}
+        QLabel#PanelTitle {{
+            color: {colors['primary']};
+            font-weight: 700;
+            letter-spacing: 1px;
+            padding-bottom: 1px;
+            border-bottom: 1px solid {cyan_glow_rgba};
+        }}
+        QLabel#PanelIcon {{
+            min-width: 14px;
+            max-width: 14px;
+            min-height: 14px;
+            max-height: 14px;
+        }}
+        QLabel#ExplorerRoot {{
+            color: {colors['muted']};
+            font-size: 12px;
+        }}
+        QLabel#MetricHeader {{
+            color: {colors['muted']};
+            font-size: 11px;
+            font-weight: 600;
+            letter-spacing: 0.8px;
+        }}
+        QTabWidget#MonitorTabs::pane {{
+            border: 1px solid {border_rgba};
+            background: {input_rgba};
+            top: -1px;
+            border-radius: 8px;
+        }}
+        QTabBar::tab {{
+            background: {panel_rgba};
+            color: {colors['muted']};
+            padding: 6px 10px;
+            border: 1px solid {border_rgba};
+            border-bottom: 1px solid {border_rgba};
+            border-top-left-radius: 6px;
+            border-top-right-radius: 6px;
+            margin-right: 2px;
+        }}
+        QTabBar::tab:hover {{
+            color: {colors['primary']};
+            border-color: {cyan_glow_rgba};
+        }}
+        QTabBar::tab:selected {{
+            color: {colors['primary']};
+            background: {cyan_wash_rgba};
+            border-color: {cyan_glow_rgba};
+            border-bottom: 2px solid {colors['primary']};
+        }}
+        QListView#MonitorList {{
+            border: 1px solid {border_rgba};
+            background: {input_rgba};
+            padding: 4px;
+            outline: none;
+            font-family: Consolas, 'JetBrains Mono', monospace;
+            font-size: 12px;
+        }}
+        QListView#MonitorList:focus {{
+            border: 1px solid {cyan_glow_rgba};
+        }}
+        QListView#MonitorList::item {{
+            min-height: 20px;
+            padding: 2px 6px;
+        }}
+        QListView#MonitorList::item:selected {{
+            background: {colors['selected_bg']};
+            border: 1px solid {magenta_glow_rgba};
+            color: {colors['primary']};
+        }}
+        QLabel#MetricLabel {{
+            color: {colors['primary']};
+            font-weight: 700;
+            font-size: 12px;
+        }}
+        QLabel#MetricValue {{
+            color: {colors['text']};
+            font-family: Consolas, 'JetBrains Mono', monospace;
+            font-size: 12px;
+        }}
+        QLabel#MetricFallback {{
+            color: {colors['muted']};
+        }}
+        QTreeView#ExplorerTree {{
+            border: 1px solid {border_rgba};
+            background: {input_rgba};
+            alternate-background-color: {list_alt_rgba};
+            padding: 4px;
+            outline: none;
+            font-family: Consolas, 'JetBrains Mono', monospace;
+            font-size: 12px;
+        }}
+        QTreeView#ExplorerTree:focus {{
+            border: 1px solid {cyan_glow_rgba};
+        }}
+        QTreeView#ExplorerTree::item {{
+            min-height: 20px;
+            padding: 2px 6px;
+        }}
+        QTreeView#ExplorerTree::item:selected {{
+            background: {colors['selected_bg']};
+            border: 1px solid {magenta_glow_rgba};
+            color: {colors['primary']};
+        }}
+        QHeaderView::section {{
+            background: {panel_rgba};
+            color: {colors['muted']};
+            padding: 4px 6px;
+            border: 1px solid {border_rgba};
+            border-top: none;
+            border-left: none;
+            font-size: 11px;
+            letter-spacing: 0.5px;
+        }}
+        QScrollBar:vertical {{
+            background: {input_rgba};
+            width: 8px;
+            margin: 2px;
+            border-radius: 4px;
+        }}
+        QScrollBar::handle:vertical {{
+            background: {colors['primary']};
+            min-height: 22px;
+            border-radius: 4px;
+        }}
+        QScrollBar::handle:vertical:hover {{
+            background: {colors['focus']};
+        }}
+        QScrollBar::handle:vertical:pressed {{
+            background: {colors['accent']};
+        }}
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+            height: 0px;
+        }}
+        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
+            background: transparent;
+        }}
+        QScrollBar:horizontal {{
+            background: {input_rgba};
+            height: 8px;
+            margin: 2px;
+            border-radius: 4px;
+        }}
+        QScrollBar::handle:horizontal {{
+            background: {colors['primary']};
+            min-width: 22px;
+            border-radius: 4px;
+        }}
+        QScrollBar::handle:horizontal:hover {{
+            background: {colors['focus']};
+        }}
+        QScrollBar::handle:horizontal:pressed {{
+            background: {colors['accent']};
+        }}
+        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+            width: 0px;
+        }}
+        QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
+            background: transparent;
+        }}
+        QSplitter::handle {{
+            background: {border_rgba};
+        }}
+        QSplitter::handle:hover {{
+            background: {cyan_glow_rgba};
+        }}
+        """
+    )
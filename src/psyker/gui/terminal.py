@@ -65,12 +65,14 @@ class AsyncGUIAdapter(QObject):
 
     write_signal = Signal(str)
     write_error_signal = Signal(str)
+    write_lines_signal = Signal(list)
 
     def __init__(self, output: QPlainTextEdit) -> None:
         super().__init__()
         self._output = output
         self.write_signal.connect(self._on_write)
         self.write_error_signal.connect(self._on_write_error)
+        self.write_lines_signal.connect(self._on_write_lines)
 
     def _on_write(self, text: str) -> None:
         self._append_line(text)
@@ -78,13 +80,21 @@ class AsyncGUIAdapter(QObject):
     def _on_write_error(self, text: str) -> None:
         self._append_line(text)
 
+    def _on_write_lines(self, lines: list[str]) -> None:
+        self._append_text("\n".join(self._plain(line) for line in lines) + "\n")
+
     def _append_line(self, text: str) -> None:
-        plain = strip_ansi(text).replace("\r\n", "\n").replace("\r", "\n").rstrip("\n").expandtabs(4)
+        plain = self._plain(text)
+        self._append_text(f"{plain}\n")
+
+    @staticmethod
+    def _plain(text: str) -> str:
+        return strip_ansi(text).replace("\r\n", "\n").replace("\r", "\n").rstrip("\n").expandtabs(4)
+
+    def _append_text(self, text: str) -> None:
         cursor = self._output.textCursor()
         cursor.movePosition(QTextCursor.End)
-        if plain:
-            cursor.insertText(plain)
-        cursor.insertText("\n")
+        cursor.insertText(text)
         self._output.setTextCursor(cursor)
         self._output.ensureCursorVisible()
 
@@ -94,6 +104,10 @@ class AsyncGUIAdapter(QObject):
     def write_error(self, text: str) -> None:
         self.write_error_signal.emit(text)
 
+    def write_lines(self, lines: list[str]) -> None:
+        if lines:
+            self.write_lines_signal.emit(list(lines))
+
     def read_line(self, prompt: str = "") -> str | None:
         return None
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 import sys
 
@@ -32,6 +33,16 @@ def find_asset(relative_path: str | Path) -> Path | None:
 
 
 def render_svg_icon(icon_name: str, color: str, size: int = 16) -> QPixmap | None:
+    image = _render_svg_image(icon_name, color, size)
+    if image is None:
+        return None
+    return QPixmap.fromImage(image)
+
+
+@lru_cache(maxsize=128)
+def _render_svg_image(icon_name: str, color: str, size: int) -> QImage | None:
+    # Panels re-theme with the same few (icon, color, size) combinations; parse and rasterize each once.
+    # Cached as QImage so no QPixmap outlives the application.
     icon_path = find_asset(Path("ui") / "icons" / f"{icon_name}.svg")
     if icon_path is None:
         return None
@@ -50,7 +61,7 @@ def render_svg_icon(icon_name: str, color: str, size: int = 16) -> QPixmap | Non
     painter = QPainter(image)
     renderer.render(painter)
     painter.end()
-    return QPixmap.fromImage(image)
+    return image
 
 
 class DecalOverlay(QWidget):
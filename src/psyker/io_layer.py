@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 import sys
-from typing import Protocol
+from typing import Callable, Protocol
 
 
 ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
@@ -26,6 +26,10 @@ class IOAdapter(Protocol):
         """Write error output."""
         ...
 
+    def write_lines(self, lines: list[str]) -> None:
+        """Write several output lines in one operation (one line per item)."""
+        ...
+
     def read_line(self, prompt: str = "") -> str | None:
         """Read one line of input. Optional prompt. Returns None on EOF."""
         ...
@@ -47,16 +51,25 @@ class TextIOAdapter:
     ) -> None:
         self._out = out or sys.stdout
         self._err = err or sys.stderr
+        # Line-buffered streams (TTYs, stderr) already flush on the trailing newline.
+        self._out_flush = _flush_fn(self._out)
+        self._err_flush = _flush_fn(self._err)
         # Resolve input at call time so tests can patch builtins.input
         self._read_fn = read_fn if read_fn is not None else (lambda p: __import__("builtins").input(p))
 
     def write(self, text: str) -> None:
         self._out.write(text + "\n")
-        self._out.flush()
+        self._out_flush()
 
     def write_error(self, text: str) -> None:
         self._err.write(text + "\n")
-        self._err.flush()
+        self._err_flush()
+
+    def write_lines(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        self._out.write("\n".join(lines) + "\n")
+        self._out_flush()
 
     def read_line(self, prompt: str = "") -> str | None:
         try:
@@ -67,3 +80,13 @@ class TextIOAdapter:
     @property
     def supports_colors(self) -> bool:
         return bool(getattr(self._out, "isatty", lambda: False)())
+
+
+def _flush_fn(stream) -> Callable[[], None]:
+    if getattr(stream, "line_buffering", False):
+        return _noop
+    return stream.flush
+
+
+def _noop() -> None:
+    pass
@@ -34,6 +34,8 @@ class RuntimeState:
     agents: Dict[str, AgentDef] = field(default_factory=dict)
     tasks: Dict[str, TaskDef] = field(default_factory=dict)
     batches: Dict[str, BatchDef] = field(default_factory=dict)
+    # Bumped on every successful load so callers can invalidate derived views.
+    version: int = field(default=0, init=False, repr=False, compare=False)
     _rr_index: Dict[str, int] = field(default_factory=dict)
     _cancel_check: Callable[[], bool] = field(default=lambda: False, repr=False)
 
@@ -67,6 +69,7 @@ class RuntimeState:
         self.agents = agents_copy
         self.tasks = tasks_copy
         self.batches = batches_copy
+        self.version += 1
         return document
 
     def run_task(self, agent_name: str, task_name: str) -> ExecutionResult:
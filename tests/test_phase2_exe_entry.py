@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
+import subprocess
 import sys
 import tempfile
 from types import SimpleNamespace
@@ -142,6 +144,13 @@ class ExeEntryTests(unittest.TestCase):
         self.assertEqual(result, 9)
         mocked_run_gui.assert_called_once_with(verbose=True, check_updates=True)
 
+    def test_entry_import_defers_cli_and_update_check(self) -> None:
+        src_root = str(Path(__file__).resolve().parents[1] / "src")
+        env = dict(os.environ, PYTHONPATH=src_root)
+        probe = "import sys, psyker.entry; print('psyker.cli' in sys.modules, 'psyker.update_check' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, env=env, check=True)
+        self.assertEqual(result.stdout.strip(), "False False")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -29,6 +29,14 @@ class RuntimeLoadTests(unittest.TestCase):
         after = (dict(self.runtime.workers), dict(self.runtime.agents), dict(self.runtime.tasks))
         self.assertEqual(before, after)
 
+    def test_version_bumps_only_on_successful_load(self) -> None:
+        self.assertEqual(self.runtime.version, 0)
+        self.runtime.load_file(self.root / "valid" / "worker_basic.psyw")
+        self.assertEqual(self.runtime.version, 1)
+        with self.assertRaises(ReferenceError):
+            self.runtime.load_file(self.root / "valid" / "agent_two_workers.psya")
+        self.assertEqual(self.runtime.version, 1)
+
     def test_invalid_parse_fixtures_fail_load(self) -> None:
         fixtures = {
             "task_missing_semicolon.psy": SyntaxError,
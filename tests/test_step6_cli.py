@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import io
 from pathlib import Path
+import subprocess
 import sys
 import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from psyker.errors import ExecError
 from psyker import __version__
-from psyker.cli import PROMPT_TEXT, PsykerCLI
+from psyker.cli import PROMPT_TEXT, PsykerCLI, _PsykerInputLexer
+from psyker.io_layer import TextIOAdapter
 from psyker.runtime import RuntimeState
 from psyker.sandbox import Sandbox
 
@@ -38,6 +40,17 @@ class CLITests(unittest.TestCase):
         self.assertEqual(code, 0)
         self.assertIn('"name": "alpha"', self.out.getvalue())
 
+    def test_ls_rows_refresh_after_new_load(self) -> None:
+        self.runtime.load_file(self.grammar / "valid" / "worker_basic.psyw")
+        self.assertEqual(self.cli.execute_line("ls agents"), 0)
+        self.assertIn("(empty)", self.out.getvalue())
+        self.runtime.load_file(self.grammar / "valid" / "agent_basic.psya")
+        self.out.truncate(0)
+        self.out.seek(0)
+        self.assertEqual(self.cli.execute_line("ls agents"), 0)
+        self.assertIn("alpha", self.out.getvalue())
+        self.assertIn("worker_instances", self.out.getvalue())
+
     def test_load_dir_loads_worker_agent_task_in_dependency_order(self) -> None:
         bundle = Path(self.temp.name) / "bundle"
         bundle.mkdir(parents=True, exist_ok=True)
@@ -130,6 +143,37 @@ class CLITests(unittest.TestCase):
         self.cli.execute_line(f'load "{self.grammar / "invalid" / "task_path_traversal.psy"}"')
         self.assertEqual(self.cli.execute_line("run alpha escape"), 4)
 
+    def test_stx_json_output_matches_without_orjson(self) -> None:
+        self.runtime.load_file(self.grammar / "valid" / "worker_basic.psyw")
+        self.assertEqual(self.cli.execute_line("stx worker w1 --output json"), 0)
+        default_output = self.out.getvalue()
+        self.out.seek(0)
+        self.out.truncate()
+        with patch("psyker.cli._orjson", new=None):
+            self.assertEqual(self.cli.execute_line("stx worker w1 --output json"), 0)
+        self.assertEqual(self.out.getvalue(), default_output)
+        self.assertIn('"capability": "fs.open"', default_output)
+
+        task_file = Path(self.temp.name) / "unicode.psy"
+        task_file.write_text(
+            '@access { agents: [alpha], workers: [w1] }\n'
+            "task unicode {\n"
+            '  fs.open "caf\u00e9.txt";\n'
+            "}\n",
+            encoding="utf-8",
+        )
+        self.runtime.load_file(task_file)
+        self.out.seek(0)
+        self.out.truncate()
+        self.assertEqual(self.cli.execute_line("stx task unicode --output json"), 0)
+        default_output = self.out.getvalue()
+        self.out.seek(0)
+        self.out.truncate()
+        with patch("psyker.cli._orjson", new=None):
+            self.assertEqual(self.cli.execute_line("stx task unicode --output json"), 0)
+        self.assertEqual(self.out.getvalue(), default_output)
+        self.assertIn('caf\\u00e9.txt', default_output)
+
     def test_dev_utilities_and_exec_error_code(self) -> None:
         self.assertEqual(self.cli.execute_line("mkdir logs"), 0)
         self.assertEqual(self.cli.execute_line("mkfile logs/out.txt"), 0)
@@ -138,20 +182,56 @@ class CLITests(unittest.TestCase):
         self.assertEqual(self.cli.execute_line("open logs/out.txt"), 0)
         self.assertIn("utility", self.out.getvalue())
 
-        with patch("psyker.cli.subprocess.run") as mocked:
+        with patch("psyker.cli.subprocess.Popen") as mocked:
             mocked.return_value.returncode = 1
-            mocked.return_value.stdout = ""
-            mocked.return_value.stderr = "bad"
+            mocked.return_value.communicate.return_value = (b"", b"bad")
             self.assertEqual(self.cli.execute_line('cmd "echo hi"'), 5)
+        self.assertIn("bad", self.err.getvalue())
+        self.assertNotIn("text", mocked.call_args.kwargs)
+
+    def test_interrupted_exec_kills_child_process(self) -> None:
+        with patch("psyker.cli.subprocess.Popen") as mocked:
+            mocked.return_value.communicate.side_effect = KeyboardInterrupt
+            with self.assertRaises(KeyboardInterrupt):
+                self.cli.execute_line('cmd "echo hi"')
+        mocked.return_value.kill.assert_called_once()
+        mocked.return_value.wait.assert_called()
+
+    def test_text_adapter_skips_flush_for_line_buffered_streams(self) -> None:
+        buffered = MagicMock(line_buffering=True)
+        piped = io.StringIO()
+        with patch.object(piped, "flush") as piped_flush:
+            adapter = TextIOAdapter(out=buffered, err=piped)
+            adapter.write("x")
+            adapter.write_error("y")
+        buffered.write.assert_called_once_with("x\n")
+        buffered.flush.assert_not_called()
+        piped_flush.assert_called_once()
+
+    def test_cmd_exec_decodes_captured_bytes_with_universal_newlines(self) -> None:
+        with patch("psyker.cli.subprocess.Popen") as mocked:
+            mocked.return_value.returncode = 0
+            mocked.return_value.communicate.return_value = (b"one\r\ntwo\r\n", b"")
+            self.assertEqual(self.cli.execute_line('cmd "echo hi"'), 0)
+        self.assertIn("one\ntwo\n", self.out.getvalue())
+        self.assertNotIn("\r", self.out.getvalue())
+
+    def test_cmd_exec_terminates_child_when_cancel_requested(self) -> None:
+        with patch("psyker.cli.subprocess.Popen") as mocked:
+            proc = mocked.return_value
+            proc.communicate.side_effect = subprocess.TimeoutExpired("cmd", 0.1)
+            self.cli.request_cancel()
+            self.assertEqual(self.cli.execute_line('cmd "pause"'), 5)
+        proc.terminate.assert_called_once()
+        self.assertIn("Command cancelled by user.", self.err.getvalue())
 
     def test_cmd_exec_uses_hidden_windows_subprocess_when_available(self) -> None:
         if sys.platform != "win32":
             self.skipTest("Windows-specific subprocess behavior")
 
-        with patch("psyker.cli.subprocess.run") as mocked:
+        with patch("psyker.cli.subprocess.Popen") as mocked:
             mocked.return_value.returncode = 0
-            mocked.return_value.stdout = ""
-            mocked.return_value.stderr = ""
+            mocked.return_value.communicate.return_value = (b"", b"")
             code = self.cli.execute_line('cmd "echo hi"')
 
         self.assertEqual(code, 0)
@@ -253,10 +333,9 @@ class CLITests(unittest.TestCase):
 
         with patch("sys.stdin.isatty", return_value=True):
             with patch("sys.stdout.isatty", return_value=True):
-                with patch("psyker.cli._pt_Style", new=_FakeStyle):
-                    with patch("psyker.cli._pt_InMemoryHistory", new=_FakeHistory):
-                        with patch("psyker.cli._pt_prompt", side_effect=EOFError) as mocked_prompt:
-                            code = cli.run_repl()
+                mocked_prompt = MagicMock(side_effect=EOFError)
+                with patch("psyker.cli._prompt_toolkit", return_value=(mocked_prompt, _FakeHistory, _FakeStyle)):
+                    code = cli.run_repl()
 
         self.assertEqual(code, 0)
         self.assertEqual(mocked_prompt.call_args.args[0], [("class:prompt", PROMPT_TEXT)])
@@ -289,10 +368,8 @@ class CLITests(unittest.TestCase):
 
         with patch("sys.stdin.isatty", return_value=True):
             with patch("sys.stdout.isatty", return_value=True):
-                with patch("psyker.cli._pt_Style", new=_FakeStyle):
-                    with patch("psyker.cli._pt_InMemoryHistory", new=_FakeHistory):
-                        with patch("psyker.cli._pt_prompt", side_effect=_fake_prompt):
-                            code = cli.run_repl()
+                with patch("psyker.cli._prompt_toolkit", return_value=(_fake_prompt, _FakeHistory, _FakeStyle)):
+                    code = cli.run_repl()
 
         self.assertEqual(code, 0)
         self.assertGreaterEqual(len(history_ids), 2)
@@ -300,13 +377,15 @@ class CLITests(unittest.TestCase):
 
     def test_run_repl_falls_back_when_prompt_toolkit_is_unavailable(self) -> None:
         cli = PsykerCLI(self.runtime)
-        with patch("psyker.cli._pt_prompt", new=None):
+        with patch("psyker.cli._prompt_toolkit", return_value=None):
             with patch("sys.stdin.isatty", return_value=True):
                 with patch("sys.stdout.isatty", return_value=True):
                     with patch("builtins.input", side_effect=EOFError) as mocked_input:
-                        code = cli.run_repl()
+                        with patch("psyker.cli._enable_readline_history") as enable_history:
+                            code = cli.run_repl()
         self.assertEqual(code, 0)
         mocked_input.assert_called_once_with(PROMPT_TEXT)
+        enable_history.assert_called_once_with(self.sandbox.root / ".psyker_history")
 
     def test_run_repl_falls_back_after_prompt_toolkit_error(self) -> None:
         cli = PsykerCLI(self.runtime)
@@ -321,16 +400,79 @@ class CLITests(unittest.TestCase):
 
         with patch("sys.stdin.isatty", return_value=True):
             with patch("sys.stdout.isatty", return_value=True):
-                with patch("psyker.cli._pt_Style", new=_FakeStyle):
-                    with patch("psyker.cli._pt_InMemoryHistory", new=_FakeHistory):
-                        with patch("psyker.cli._pt_prompt", side_effect=RuntimeError("prompt failed")) as mocked_prompt:
-                            with patch("builtins.input", side_effect=EOFError) as mocked_input:
-                                code = cli.run_repl()
+                mocked_prompt = MagicMock(side_effect=RuntimeError("prompt failed"))
+                with patch("psyker.cli._prompt_toolkit", return_value=(mocked_prompt, _FakeHistory, _FakeStyle)):
+                    with patch("builtins.input", side_effect=EOFError) as mocked_input:
+                        code = cli.run_repl()
 
         self.assertEqual(code, 0)
         mocked_prompt.assert_called_once()
         mocked_input.assert_called_once_with(PROMPT_TEXT)
 
+    def test_execute_line_tokenizes_plain_and_quoted_lines_alike(self) -> None:
+        seen: list[list[str]] = []
+
+        def _capture(args: list[str]) -> int:
+            seen.append(args)
+            return 0
+
+        with patch.object(self.cli, "_cmd_open", _capture):
+            self.assertEqual(self.cli.execute_line("open  a.txt   b.txt"), 0)
+            self.assertEqual(self.cli.execute_line('open "a.txt" \'b.txt\''), 0)
+            self.assertEqual(self.cli.execute_line("open a\tb"), 0)
+            self.assertEqual(self.cli.execute_line('open "unterminated'), 1)
+        self.assertEqual(seen, [["a.txt", "b.txt"], ["a.txt", "b.txt"], ["a", "b"]])
+        self.assertIn("error[CliParse]", self.err.getvalue())
+
+    def test_subclass_overrides_dispatch_and_commands_bind_to_instance(self) -> None:
+        class _CLI(PsykerCLI):
+            def _cmd_open(self, args: list[str]) -> int:
+                return 7
+
+        cli = _CLI(self.runtime, out=self.out, err=self.err)
+        self.assertEqual(cli.execute_line("open a.txt"), 7)
+        self.assertEqual(cli.commands["open"].handler(["a.txt"]), 7)
+        self.assertIs(cli.commands["help"].handler.__self__, cli)
+
+    def test_ps_and_cmd_pass_quoted_tail_through_verbatim(self) -> None:
+        calls: list[tuple[str, list[str]]] = []
+        with (
+            patch.object(self.cli, "_cmd_ps", lambda args: calls.append(("ps", args)) or 0),
+            patch.object(self.cli, "_cmd_cmd", lambda args: calls.append(("cmd", args)) or 0),
+        ):
+            self.cli.execute_line('ps "Write-Output "a b""')
+            self.cli.execute_line('cmd   "dir C:\\Temp"  ')
+            self.cli.execute_line("cmd 'echo hi'")
+            self.cli.execute_line('cmd "echo \\"hi\\""')
+            self.cli.execute_line('cmd "dir C:\\\\"')
+            self.assertEqual(self.cli.execute_line('ps "a" b"'), 1)
+        self.assertEqual(
+            calls,
+            [
+                ("ps", ['Write-Output "a b"']),
+                ("cmd", ["dir C:\\Temp"]),
+                ("cmd", ["echo hi"]),
+                ("cmd", ['echo "hi"']),
+                ("cmd", ["dir C:\\"]),
+            ],
+        )
+        self.assertNotEqual(self.cli.execute_line('ps "a" "b"'), 0)
+        self.assertIn("Usage: ps", self.err.getvalue())
+        self.assertIn("error[CliParse]", self.err.getvalue())
+
+    def test_input_lexer_styles_verb_and_flags_and_reuses_parts(self) -> None:
+        class _Doc:
+            def __init__(self, text: str) -> None:
+                self.text = text
+
+        lexer = _PsykerInputLexer(self.cli.commands)
+        parts = lexer.lex_document(_Doc("  stx agent alpha --output json"))(0)
+        self.assertEqual(parts[0], ("", "  "))
+        self.assertEqual(parts[1], ("class:command", "stx"))
+        self.assertIn(("class:flag", "--output"), parts)
+        self.assertIs(lexer.lex_document(_Doc("  stx agent alpha --output json"))(0), parts)
+        self.assertEqual(lexer.lex_document(_Doc("nope"))(0), [("", "nope")])
+
 
 class CLIv013Tests(unittest.TestCase):
     """Tests for v0.1.3 features: batch run, fs.mkdir via CLI, --script mode."""